@@ -0,0 +1 @@
+"""Shared data-fetching and rendering helpers used by the plotting scripts."""
@@ -0,0 +1,114 @@
+import numpy as np
+
+
+class BarRace:
+    """
+    A bar-chart race drawn with one set of artists for the whole animation.
+
+    The bars, value labels and tick positions are created once; update()
+    only moves every bar to its slot for the frame's ordering, resizes it,
+    rewrites the tick and value labels and, if the values outgrow them,
+    the axis limits. Nothing is cleared or rebuilt between frames.
+
+    Bars are horizontal with the largest on top by default, or vertical
+    with the largest on the right. update() returns the artists it
+    changed, for FuncAnimation(blit=True) on races whose limits are fixed.
+    """
+
+    def __init__(
+        self,
+        ax,
+        categories,
+        colors,
+        horizontal=True,
+        bar_size=0.8,
+        value_format="{:,.0f}".format,
+        value_position=lambda value: value * 1.01,
+        value_kwargs=None,
+        tick_kwargs=None,
+        limit=None,
+    ):
+        """
+        colors maps each category to its bar color. value_format turns a
+        value into its label and value_position gives the label's offset
+        coordinate along the value axis. limit is either a fixed upper
+        value-axis limit or a callable mapping the frame's largest value
+        to one.
+        """
+        self.ax = ax
+        self.categories = list(categories)
+        self.horizontal = horizontal
+        self.bar_size = bar_size
+        self.value_format = value_format
+        self.value_position = value_position
+        self.limit = limit
+        self._tick_kwargs = tick_kwargs or {}
+        self._limit_value = None
+
+        n = len(self.categories)
+        slots = np.arange(n)
+        zeros = np.zeros(n)
+        bar_colors = [colors[c] for c in self.categories]
+        if horizontal:
+            self.bars = ax.barh(slots, zeros, height=bar_size, color=bar_colors)
+            ax.set_yticks(slots)
+            ax.invert_yaxis()  # Largest value at the top
+        else:
+            self.bars = ax.bar(slots, zeros, width=bar_size, color=bar_colors)
+            ax.set_xticks(slots)
+        self.value_texts = [
+            ax.text(0, 0, "", **(value_kwargs or {})) for _ in self.categories
+        ]
+        if limit is not None and not callable(limit):
+            self._set_limit(limit)
+
+    def _set_limit(self, upper):
+        if upper != self._limit_value:
+            if self.horizontal:
+                self.ax.set_xlim(0, upper)
+            else:
+                self.ax.set_ylim(0, upper)
+            self._limit_value = upper
+
+    def update(self, values):
+        """
+        Redraws the race for one frame. values holds one value per category
+        (in the constructor's order); NaN hides that category's bar.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        shown = ~np.isnan(values)
+        # Horizontal races put the largest bar in slot 0 (the top); vertical
+        # ones in the last slot (the right).
+        keys = np.where(shown, values, -np.inf)
+        order = np.argsort(-keys if self.horizontal else keys, kind="stable")
+        if not self.horizontal:
+            order = np.roll(order, -int((~shown).sum()))
+        slots = np.empty_like(order)
+        slots[order] = np.arange(len(order))
+
+        for bar, text, value, slot, visible in zip(
+            self.bars, self.value_texts, values, slots, shown
+        ):
+            bar.set_visible(visible)
+            text.set_visible(visible)
+            if not visible:
+                continue
+            if self.horizontal:
+                bar.set_y(slot - self.bar_size / 2)
+                bar.set_width(value)
+                text.set_position((self.value_position(value), slot))
+            else:
+                bar.set_x(slot - self.bar_size / 2)
+                bar.set_height(value)
+                text.set_position((slot, self.value_position(value)))
+            text.set_text(self.value_format(value))
+
+        labels = [self.categories[i] if shown[i] else "" for i in order]
+        if self.horizontal:
+            self.ax.set_yticklabels(labels, **self._tick_kwargs)
+        else:
+            self.ax.set_xticklabels(labels, **self._tick_kwargs)
+
+        if callable(self.limit) and shown.any():
+            self._set_limit(self.limit(values[shown].max()))
+        return [*self.bars, *self.value_texts]
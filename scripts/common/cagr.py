@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+
+class CagrMatrix:
+    """
+    Compound annual growth rates of every country over every (start, end)
+    window of an annual panel, computed in one pass over log values.
+
+    rates is a (start x end x country) array that is only filled above the
+    diagonal (start < end); every other entry is NaN, as is any window with
+    a missing or non-positive endpoint. Lookups by year are O(1).
+    """
+
+    def __init__(self, values, years, countries):
+        values = np.asarray(values, dtype=np.float64)
+        self.years = np.asarray(years, dtype=int)
+        self.countries = pd.Index(countries, name="Country")
+        self._year_pos = {year: i for i, year in enumerate(self.years)}
+        self._country_pos = {name: i for i, name in enumerate(self.countries)}
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_values = np.where(values > 0, np.log(values), np.nan)
+            spans = (self.years[np.newaxis, :] - self.years[:, np.newaxis]).astype(
+                np.float64
+            )
+            spans[np.tril_indices(len(self.years))] = np.nan
+            log_growth = log_values[np.newaxis, :, :] - log_values[:, np.newaxis, :]
+            self.rates = np.expm1(log_growth / spans[:, :, np.newaxis])
+
+    @classmethod
+    def from_frame(cls, df):
+        """Builds the matrix from a wide (year x country) DataFrame."""
+        years = df.index.year if isinstance(df.index, pd.DatetimeIndex) else df.index
+        return cls(df.to_numpy(dtype=np.float64), years, df.columns)
+
+    def rate(self, start, end, country):
+        """Returns the CAGR of one country from start to end."""
+        return self.rates[
+            self._year_pos[start], self._year_pos[end], self._country_pos[country]
+        ]
+
+    def window(self, start, end):
+        """Returns the CAGR of every country from start to end as a Series."""
+        return pd.Series(
+            self.rates[self._year_pos[start], self._year_pos[end]],
+            index=self.countries,
+            name=f"CAGR {start}-{end}",
+        )
+
+    def table(self, country):
+        """Returns one country's (start year x end year) CAGR table."""
+        return pd.DataFrame(
+            self.rates[:, :, self._country_pos[country]],
+            index=pd.Index(self.years, name="Start"),
+            columns=pd.Index(self.years, name="End"),
+        )
@@ -0,0 +1,89 @@
+import os
+import re
+import unicodedata
+
+import pandas as pd
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+CODES_PATH = os.path.join(DATA_DIR, "country_codes.csv")
+
+_table = None
+_aliases = None
+
+
+def load_table():
+    """Returns the iso3/iso2/name/aliases table, loaded once per process."""
+    global _table
+    if _table is None:
+        _table = pd.read_csv(CODES_PATH, keep_default_na=False)
+    return _table
+
+
+def _normalize_one(name):
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(ch for ch in name if not unicodedata.combining(ch))
+    name = re.sub(r"\[.*?\]|[*†‡]", "", name)
+    name = name.casefold().replace("&", " and ")
+    name = re.sub(r"[^a-z0-9]+", " ", name).strip()
+    return re.sub(r"^the ", "", name)
+
+
+def _alias_index():
+    """Normalized alias -> ISO3, covering names, aliases and both code forms."""
+    global _aliases
+    if _aliases is None:
+        table = load_table()
+        _aliases = {}
+        for iso3, iso2, name, aliases in table.itertuples(index=False):
+            for alias in [iso3, iso2, name, *filter(None, aliases.split(";"))]:
+                _aliases.setdefault(_normalize_one(alias), iso3)
+    return _aliases
+
+
+def to_iso3(names):
+    """
+    Maps a Series (or list) of free-text country names to ISO3 codes in one
+    pass: each distinct spelling is normalized and looked up once. Names
+    that are not countries (regions, "World", ...) map to NaN.
+    """
+    names = pd.Series(names, dtype=object)
+    codes, uniques = pd.factorize(names, use_na_sentinel=True)
+    index = _alias_index()
+    resolved = [index.get(_normalize_one(str(name))) for name in uniques]
+    # The trailing None is what missing names (code -1) pick up.
+    lookup = pd.Series(resolved + [None], dtype=object)
+    return pd.Series(lookup.to_numpy()[codes], index=names.index, name="ISO3")
+
+
+def iso3_categorical(names):
+    """Like to_iso3, but as a Categorical over every known ISO3 code."""
+    return pd.Categorical(to_iso3(names), categories=load_table()["iso3"])
+
+
+def unmatched(names):
+    """Returns the distinct names that do not resolve to a country."""
+    names = pd.Series(names, dtype=object)
+    return sorted(names[to_iso3(names).isna()].dropna().astype(str).unique())
+
+
+def name_of(iso3):
+    """Maps ISO3 codes to the canonical country names of the table."""
+    table = load_table()
+    return pd.Series(iso3, dtype=object).map(dict(zip(table["iso3"], table["name"])))
+
+
+def merge(left, right, left_on="Country", right_on="Country", **kwargs):
+    """
+    pd.merge on canonical country codes instead of spellings. Adds an "ISO3"
+    categorical column to both sides, merges on it, and replaces the name
+    column with the canonical name.
+    """
+    left = left.assign(ISO3=iso3_categorical(left[left_on]))
+    right = right.assign(ISO3=iso3_categorical(right[right_on])).drop(
+        columns=[right_on]
+    )
+    merged = pd.merge(
+        left.dropna(subset=["ISO3"]), right.dropna(subset=["ISO3"]), on="ISO3", **kwargs
+    )
+    merged[left_on] = name_of(merged["ISO3"]).to_numpy()
+    return merged
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+
+def find_crossings(values, times=None, labels=None):
+    """
+    Finds every pairwise overtake in an N-series panel in one NumPy pass.
+
+    values is a (time x series) array or a wide DataFrame, whose columns then
+    serve as labels and whose index, if numeric, as times (otherwise times
+    are step positions, like for arrays). For every pair it looks at the
+    sign of their difference at each step and reports each change of order
+    as one event, with the crossing time and value linearly interpolated
+    between the two steps. Steps where either series is NaN are ignored.
+
+    Returns a DataFrame sorted by time with columns: time, value (of the two
+    series at the crossing), winner, loser (the series that moved above /
+    fell below the other) and step (the position of the first step after
+    the crossing).
+    """
+    if isinstance(values, pd.DataFrame):
+        if times is None and pd.api.types.is_numeric_dtype(values.index):
+            times = values.index.to_numpy()
+        labels = list(values.columns) if labels is None else labels
+        values = values.to_numpy(dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    n_steps, n_series = values.shape
+    times = np.arange(n_steps) if times is None else np.asarray(times, dtype=float)
+    labels = np.asarray(range(n_series) if labels is None else labels, dtype=object)
+
+    first, second = np.triu_indices(n_series, k=1)
+    diff = values[:, first] - values[:, second]  # (time x pair)
+    at_or_above = diff >= 0
+    valid = ~np.isnan(diff)
+
+    changed = (at_or_above[1:] != at_or_above[:-1]) & valid[1:] & valid[:-1]
+    step_before, pair = np.nonzero(changed)
+    step = step_before + 1
+
+    d_before = diff[step_before, pair]
+    d_after = diff[step, pair]
+    gap = d_before - d_after
+    fraction = np.divide(d_before, gap, out=np.zeros_like(gap), where=gap != 0)
+
+    t_before, t_after = times[step_before], times[step]
+    v_before = values[step_before, first[pair]]
+    v_after = values[step, first[pair]]
+    first_overtakes = at_or_above[step, pair]
+
+    events = pd.DataFrame(
+        {
+            "time": t_before + fraction * (t_after - t_before),
+            "value": v_before + fraction * (v_after - v_before),
+            "winner": np.where(
+                first_overtakes, labels[first[pair]], labels[second[pair]]
+            ),
+            "loser": np.where(
+                first_overtakes, labels[second[pair]], labels[first[pair]]
+            ),
+            "step": step,
+        }
+    )
+    return events.sort_values(["time", "winner", "loser"], ignore_index=True)
+
+
+def first_crossing(events, winner, loser):
+    """Returns the first event where winner overtakes loser, or None."""
+    hits = events[(events["winner"] == winner) & (events["loser"] == loser)]
+    return None if hits.empty else hits.iloc[0]
@@ -0,0 +1,77 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Named datasets are CSV files under data/datasets/ (the reviewable source of
+# truth). The first load converts one into a per-column .npy cache next to it,
+# and later loads read that cache, memory-mapping it when it is large.
+DATASETS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data", "datasets")
+CACHE_DIR = os.path.join(DATASETS_DIR, ".cache")
+# Caches bigger than this are memory-mapped instead of read into memory.
+MMAP_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+_loaded = {}
+
+
+def source_path(name):
+    return os.path.join(DATASETS_DIR, f"{name}.csv")
+
+
+def available():
+    """Returns the names of every registered dataset."""
+    return sorted(
+        os.path.splitext(f)[0] for f in os.listdir(DATASETS_DIR) if f.endswith(".csv")
+    )
+
+
+def _cache_is_fresh(name):
+    meta_path = os.path.join(CACHE_DIR, name, "columns.json")
+    return os.path.exists(meta_path) and os.path.getmtime(
+        meta_path
+    ) >= os.path.getmtime(source_path(name))
+
+
+def _write_cache(name, df):
+    target = os.path.join(CACHE_DIR, name)
+    os.makedirs(target, exist_ok=True)
+    columns = []
+    for i, column in enumerate(df.columns):
+        values = df[column].to_numpy()
+        if values.dtype == object or not np.issubdtype(values.dtype, np.number):
+            values = values.astype(str)
+        np.save(os.path.join(target, f"{i}.npy"), values)
+        columns.append(column)
+    with open(os.path.join(target, "columns.json"), "w") as f:
+        json.dump(columns, f)
+
+
+def _read_cache(name):
+    target = os.path.join(CACHE_DIR, name)
+    with open(os.path.join(target, "columns.json")) as f:
+        columns = json.load(f)
+    paths = [os.path.join(target, f"{i}.npy") for i in range(len(columns))]
+    mmap_mode = "r" if sum(map(os.path.getsize, paths)) > MMAP_THRESHOLD_BYTES else None
+    return pd.DataFrame(
+        {
+            column: np.load(path, mmap_mode=mmap_mode)
+            for column, path in zip(columns, paths)
+        },
+        copy=False,
+    )
+
+
+def load(name):
+    """
+    Returns a named dataset as a DataFrame. Nothing is read until a dataset
+    is first asked for, and each one is read at most once per process.
+    Each call returns a shallow copy, so callers can add columns freely.
+    """
+    if name not in _loaded:
+        if not os.path.exists(source_path(name)):
+            raise KeyError(f"unknown dataset {name!r}; available: {available()}")
+        if not _cache_is_fresh(name):
+            _write_cache(name, pd.read_csv(source_path(name)))
+        _loaded[name] = _read_cache(name)
+    return _loaded[name].copy(deep=False)
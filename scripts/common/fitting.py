@@ -0,0 +1,81 @@
+import numpy as np
+
+# Gauss-Newton refinement stops once no series' parameters move by more than
+# this relative amount, or after MAX_ITERATIONS steps.
+TOLERANCE = 1e-12
+MAX_ITERATIONS = 50
+
+
+def _log_linear_start(x, columns, valid):
+    """Closed-form least-squares fit of log(y) = log(a) + b * x per column."""
+    log_values = np.log(np.where(valid & (columns > 0), columns, np.nan))
+    valid = valid & ~np.isnan(log_values)
+    counts = valid.sum(axis=0)
+    x_mean = np.where(valid, x, 0.0).sum(axis=0) / counts
+    log_mean = np.where(valid, log_values, 0.0).sum(axis=0) / counts
+    x_dev = np.where(valid, x - x_mean, 0.0)
+    log_dev = np.where(valid, log_values - log_mean, 0.0)
+    b = (x_dev * log_dev).sum(axis=0) / (x_dev**2).sum(axis=0)
+    return np.exp(log_mean - b * x_mean), b
+
+
+def _sse(x, columns, valid, a, b):
+    residuals = np.where(valid, columns - a * np.exp(b * x), 0.0)
+    return (residuals**2).sum(axis=0)
+
+
+def fit_exponentials(x, columns):
+    """
+    Least-squares fits of y = a * exp(b * x) to every column of a
+    (len(x) x series) array at once; NaN entries are left out of their
+    column's fit. Starts from the log-linear fit of each column and refines
+    all of them together with damped Gauss-Newton steps. Returns (a, b)
+    arrays with one entry per series.
+    """
+    x = np.asarray(x, dtype=np.float64)[:, np.newaxis]
+    columns = np.asarray(columns, dtype=np.float64).reshape(len(x), -1)
+    valid = ~np.isnan(columns)
+    a, b = _log_linear_start(x, columns, valid)
+    sse = _sse(x, columns, valid, a, b)
+
+    for _ in range(MAX_ITERATIONS):
+        growth = np.where(valid, np.exp(b * x), 0.0)
+        residuals = np.where(valid, columns, 0.0) - a * growth
+        # Jacobian columns with respect to a and b, and the 2x2 normal
+        # equations of every series, solved in closed form.
+        d_a, d_b = growth, a * x * growth
+        aa, ab, bb = (d_a * d_a).sum(0), (d_a * d_b).sum(0), (d_b * d_b).sum(0)
+        ra, rb = (d_a * residuals).sum(0), (d_b * residuals).sum(0)
+        det = aa * bb - ab**2
+        step_a = np.divide(
+            bb * ra - ab * rb, det, out=np.zeros_like(det), where=det != 0
+        )
+        step_b = np.divide(
+            aa * rb - ab * ra, det, out=np.zeros_like(det), where=det != 0
+        )
+
+        # Halve the step of every series whose error would grow.
+        scale = np.ones_like(a)
+        for _ in range(30):
+            new_sse = _sse(x, columns, valid, a + scale * step_a, b + scale * step_b)
+            worse = new_sse > sse
+            if not worse.any():
+                break
+            scale[worse] /= 2
+        accept = new_sse <= sse
+        step_a = np.where(accept, scale * step_a, 0.0)
+        step_b = np.where(accept, scale * step_b, 0.0)
+        a, b = a + step_a, b + step_b
+        sse = np.where(accept, new_sse, sse)
+
+        moved = np.abs(step_a) > TOLERANCE * np.abs(a)
+        moved |= np.abs(step_b) > TOLERANCE * np.maximum(np.abs(b), 1.0)
+        if not moved.any():
+            break
+    return a, b
+
+
+def eval_exponentials(a, b, x):
+    """Evaluates every fitted series at x; returns a (len(x) x series) array."""
+    x = np.asarray(x, dtype=np.float64)[:, np.newaxis]
+    return np.asarray(a) * np.exp(np.asarray(b) * x)
@@ -0,0 +1,196 @@
+import numpy as np
+import pandas as pd
+
+
+class Panel:
+    """
+    Dense country x year x indicator data in one float64 array.
+
+    Values are stored as (indicator, year, country) so every indicator is a
+    contiguous (year x country) block: frame() wraps it in a DataFrame
+    without copying, and country(), year() and indicator() return NumPy views.
+    Years are contiguous integers addressed by their offset from first_year;
+    gaps are NaN.
+    """
+
+    def __init__(self, values, countries, first_year, indicators):
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 2:
+            values = values[np.newaxis]
+        self.values = values
+        self.countries = pd.CategoricalIndex(countries, name="Country")
+        self.indicators = pd.Index(indicators, name="Indicator")
+        self.first_year = int(first_year)
+        expected = (len(self.indicators), values.shape[1], len(self.countries))
+        if values.shape != expected:
+            raise ValueError(f"values shape {values.shape} does not match {expected}")
+        self._country_pos = {name: i for i, name in enumerate(self.countries)}
+        self._indicator_pos = {name: i for i, name in enumerate(self.indicators)}
+
+    def __repr__(self):
+        return (
+            f"Panel({len(self.countries)} countries x {self.years[0]}-"
+            f"{self.years[-1]} x {len(self.indicators)} indicators)"
+        )
+
+    # --- Constructors ---
+
+    @classmethod
+    def empty(cls, countries, first_year, last_year, indicators):
+        """Returns an all-NaN panel with the given axes."""
+        shape = (len(indicators), last_year - first_year + 1, len(countries))
+        return cls(np.full(shape, np.nan), countries, first_year, indicators)
+
+    @classmethod
+    def from_frame(cls, df, indicator="value"):
+        """Builds a one-indicator panel from a wide (year x country) DataFrame."""
+        years = df.index.astype(int)
+        panel = cls.empty(list(df.columns), years.min(), years.max(), [indicator])
+        panel.values[0, years - panel.first_year] = df.to_numpy(dtype=np.float64)
+        return panel
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Builds a panel from {indicator: wide (year x country) DataFrame}."""
+        countries = pd.Index([])
+        years = pd.Index([], dtype=int)
+        for df in frames.values():
+            countries = countries.union(df.columns, sort=False)
+            years = years.union(df.index.astype(int))
+        panel = cls.empty(list(countries), years.min(), years.max(), list(frames))
+        for indicator, df in frames.items():
+            block = df.reindex(columns=countries).to_numpy(dtype=np.float64)
+            rows = df.index.astype(int) - panel.first_year
+            panel.values[panel._indicator_pos[indicator], rows] = block
+        return panel
+
+    @classmethod
+    def from_long(cls, df, country="country", year="year", values=("value",)):
+        """Builds a panel from a long frame with one row per (country, year)."""
+        values = [values] if isinstance(values, str) else list(values)
+        years = df[year].astype(int).to_numpy()
+        countries = pd.Categorical(df[country])
+        panel = cls.empty(list(countries.categories), years.min(), years.max(), values)
+        rows = years - panel.first_year
+        for k, column in enumerate(values):
+            panel.values[k, rows, countries.codes] = df[column].to_numpy(
+                dtype=np.float64
+            )
+        return panel
+
+    @classmethod
+    def from_dicts(cls, data, indicator="value"):
+        """Builds a one-indicator panel from {country: {year: value}}."""
+        years = [int(y) for points in data.values() for y in points]
+        panel = cls.empty(list(data), min(years), max(years), [indicator])
+        for c, points in enumerate(data.values()):
+            rows = np.fromiter(points.keys(), dtype=int) - panel.first_year
+            panel.values[0, rows, c] = np.fromiter(points.values(), dtype=np.float64)
+        return panel
+
+    @classmethod
+    def from_records(cls, records, country, indicators):
+        """
+        Builds a single-country panel from (year, value, value, ...) tuples,
+        one value per indicator.
+        """
+        table = np.asarray(records, dtype=np.float64)
+        years = table[:, 0].astype(int)
+        panel = cls.empty([country], years.min(), years.max(), indicators)
+        panel.values[:, years - panel.first_year, 0] = table[:, 1:].T
+        return panel
+
+    # --- Axes ---
+
+    @property
+    def years(self):
+        return np.arange(self.first_year, self.first_year + self.values.shape[1])
+
+    def year_offset(self, year):
+        """
+        Returns the row of a year (or array of years). Raises KeyError for a
+        year outside the panel, which would otherwise wrap around or overrun.
+        """
+        offset = np.asarray(year) - self.first_year
+        outside = (offset < 0) | (offset >= self.values.shape[1])
+        if np.any(outside):
+            raise KeyError(f"No {year} row in {self!r}")
+        return offset
+
+    def country_pos(self, country):
+        return self._country_pos[country]
+
+    def indicator_pos(self, indicator):
+        return self._indicator_pos[indicator]
+
+    # --- O(1) slicing (all views) ---
+
+    def country(self, country):
+        """Returns the (indicator x year) view of one country."""
+        return self.values[:, :, self._country_pos[country]]
+
+    def year(self, year):
+        """Returns the (indicator x country) view of one year."""
+        return self.values[:, self.year_offset(year), :]
+
+    def indicator(self, indicator="value"):
+        """Returns the (year x country) view of one indicator."""
+        return self.values[self._indicator_pos[indicator]]
+
+    def cell(self, country, year, indicator="value"):
+        return self.values[
+            self._indicator_pos[indicator],
+            self.year_offset(year),
+            self._country_pos[country],
+        ]
+
+    def series(self, country, indicator="value"):
+        """Returns one country's indicator as a year-indexed Series view."""
+        return pd.Series(
+            self.indicator(indicator)[:, self._country_pos[country]],
+            index=pd.Index(self.years, name="Year"),
+            name=country,
+            copy=False,
+        )
+
+    # --- pandas views ---
+
+    def frame(self, indicator="value"):
+        """Returns a wide (year x country) DataFrame sharing the panel's memory."""
+        return pd.DataFrame(
+            self.indicator(indicator),
+            index=pd.Index(self.years, name="Year"),
+            columns=pd.Index(list(self.countries), name="Country"),
+            copy=False,
+        )
+
+    def to_long(self):
+        """Returns a long (country, year, indicator columns) copy of the panel."""
+        n_years, n_countries = self.values.shape[1:]
+        data = {
+            "Country": np.tile(np.asarray(self.countries), n_years),
+            "Year": np.repeat(self.years, n_countries),
+        }
+        for k, indicator in enumerate(self.indicators):
+            data[indicator] = self.values[k].ravel()
+        return pd.DataFrame(data)
+
+    def select(self, countries=None, years=None, indicators=None):
+        """Returns a sub-panel; a view when only years are restricted."""
+        values = self.values
+        first_year = self.first_year
+        if years is not None:
+            lo, hi = years
+            if hi < lo:
+                raise KeyError(f"Empty year range {lo}-{hi}")
+            values = values[:, self.year_offset(lo) : self.year_offset(hi) + 1]
+            first_year = lo
+        country_list = list(self.countries)
+        if countries is not None:
+            values = values[:, :, [self._country_pos[c] for c in countries]]
+            country_list = list(countries)
+        indicator_list = list(self.indicators)
+        if indicators is not None:
+            values = values[[self._indicator_pos[i] for i in indicators]]
+            indicator_list = list(indicators)
+        return Panel(values, country_list, first_year, indicator_list)
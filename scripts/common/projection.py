@@ -0,0 +1,116 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+_polynomial_fits = {}
+
+
+def compound(base_values, growth_factors, steps):
+    """
+    Projects every series over a whole horizon in one broadcasted step.
+    Returns a (steps x series) array whose row k is base * growth ** (k + 1).
+    """
+    base_values = np.asarray(base_values, dtype=np.float64)
+    growth_factors = np.asarray(growth_factors, dtype=np.float64)
+    offsets = np.arange(1, steps + 1, dtype=np.float64)[:, np.newaxis]
+    return base_values * growth_factors**offsets
+
+
+def extend_monthly(df_monthly, annual_growth_factors, end_period):
+    """
+    Extends a monthly, PeriodIndex-ed DataFrame to end_period by compounding
+    each column's annual growth factor month by month from its last value.
+    The result is allocated once at its final size.
+    """
+    last_period = df_monthly.index.max()
+    end_period = pd.Period(end_period, freq="M")
+    steps = max((end_period - last_period).n, 0)
+    columns = list(df_monthly.columns)
+    monthly_factors = [annual_growth_factors[c] ** (1 / 12) for c in columns]
+
+    values = np.empty((len(df_monthly) + steps, len(columns)))
+    values[: len(df_monthly)] = df_monthly.to_numpy(dtype=np.float64)
+    values[len(df_monthly) :] = compound(
+        values[len(df_monthly) - 1], monthly_factors, steps
+    )
+    index = pd.period_range(df_monthly.index.min(), periods=len(values), freq="M")
+    return pd.DataFrame(values, index=index, columns=df_monthly.columns, copy=False)
+
+
+def fit_log_linear(df):
+    """
+    Fits log(value) = intercept + slope * year to every column of a
+    year-indexed DataFrame at once, using only each column's non-NaN rows.
+    Returns (slope, intercept) arrays with one entry per column.
+    """
+    years = df.index.to_numpy(dtype=np.float64)[:, np.newaxis]
+    log_values = np.log(df.to_numpy(dtype=np.float64))
+    valid = ~np.isnan(log_values)
+    counts = valid.sum(axis=0)
+
+    year_mean = np.where(valid, years, 0.0).sum(axis=0) / counts
+    log_mean = np.where(valid, log_values, 0.0).sum(axis=0) / counts
+    year_dev = np.where(valid, years - year_mean, 0.0)
+    log_dev = np.where(valid, log_values - log_mean, 0.0)
+    slope = (year_dev * log_dev).sum(axis=0) / (year_dev**2).sum(axis=0)
+    return slope, log_mean - slope * year_mean
+
+
+def extrapolate_log_linear(df, future_years):
+    """
+    Projects every column of a year-indexed DataFrame to future_years along
+    its fitted log-linear trend, in one broadcasted evaluation.
+    """
+    slope, intercept = fit_log_linear(df)
+    future_years = np.asarray(future_years)
+    values = np.exp(intercept + slope * future_years[:, np.newaxis].astype(np.float64))
+    return pd.DataFrame(
+        values,
+        index=pd.Index(future_years, name=df.index.name),
+        columns=df.columns,
+        copy=False,
+    )
+
+
+def fit_polynomials(x, columns, degrees):
+    """
+    Least-squares polynomial fits of every column of a (len(x) x series)
+    array against x, with series i getting degree degrees[i] (or one
+    shared int). x is centered and scaled to [-1, 1] first, which keeps
+    high degrees on calendar years well conditioned; series sharing a
+    degree are solved together. Returns (coeffs, center, half_width), with
+    coeffs (max degree + 1 x series) in the scaled variable, lowest order
+    first. Fits are cached by a hash of their inputs.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    columns = np.asarray(columns, dtype=np.float64).reshape(len(x), -1)
+    degrees = np.broadcast_to(np.asarray(degrees, dtype=int), columns.shape[1:])
+
+    key = hashlib.sha1(
+        b"".join(np.ascontiguousarray(a).tobytes() for a in (x, columns, degrees))
+    ).hexdigest()
+    if key not in _polynomial_fits:
+        center = (x.max() + x.min()) / 2
+        half_width = (x.max() - x.min()) / 2 or 1.0
+        vander = np.polynomial.polynomial.polyvander(
+            (x - center) / half_width, degrees.max()
+        )
+        coeffs = np.zeros((degrees.max() + 1, columns.shape[1]))
+        for degree in np.unique(degrees):
+            series = degrees == degree
+            coeffs[: degree + 1, series] = np.linalg.lstsq(
+                vander[:, : degree + 1], columns[:, series], rcond=None
+            )[0]
+        _polynomial_fits[key] = (coeffs, center, half_width)
+    return _polynomial_fits[key]
+
+
+def eval_polynomials(fit, x):
+    """
+    Evaluates every series of a fit_polynomials() fit at x in one pass.
+    Returns a (len(x) x series) array.
+    """
+    coeffs, center, half_width = fit
+    scaled = (np.asarray(x, dtype=np.float64) - center) / half_width
+    return np.polynomial.polynomial.polyvander(scaled, len(coeffs) - 1) @ coeffs
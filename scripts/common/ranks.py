@@ -0,0 +1,119 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+_rankings = {}
+
+
+def percentile(rank, total):
+    """
+    Competitive percentile of a rank among total entrants: 100 for first
+    place, falling by 100 / total per place.
+    """
+    return (1 - (rank - 1) / total) * 100
+
+
+def rank_values(values, ascending=False):
+    """
+    Ranks every row of a (year x country) array with one argsort over the
+    country axis, highest value first unless ascending. Ties share the
+    best rank ("1, 2, 2, 4"). NaN entries are not ranked.
+
+    Returns (ranks, totals) as int16 arrays: ranks is (year x country)
+    with 0 where unranked, totals the number of ranked countries per year.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    missing = np.isnan(values)
+    keys = np.where(missing, np.inf, values if ascending else -values)
+
+    order = np.argsort(keys, axis=1, kind="stable")
+    sorted_keys = np.take_along_axis(keys, order, axis=1)
+    positions = np.broadcast_to(np.arange(keys.shape[1]), keys.shape)
+    starts_run = np.ones(keys.shape, dtype=bool)
+    starts_run[:, 1:] = sorted_keys[:, 1:] != sorted_keys[:, :-1]
+    sorted_ranks = np.maximum.accumulate(np.where(starts_run, positions, 0), axis=1)
+
+    ranks = np.empty(keys.shape, dtype=np.int16)
+    np.put_along_axis(ranks, order, (sorted_ranks + 1).astype(np.int16), axis=1)
+    ranks[missing] = 0
+    return ranks, (~missing).sum(axis=1).astype(np.int16)
+
+
+class Ranking:
+    """
+    Ranks and percentiles of every country in every year of a panel.
+    Rankings are computed once per distinct input and cached.
+    """
+
+    def __init__(self, ranks, totals, years, countries):
+        self.ranks = ranks
+        self.totals = totals
+        self.years = pd.Index(years, name="Year")
+        self.countries = pd.Index(countries, name="Country")
+        self._year_pos = {year: i for i, year in enumerate(self.years)}
+        self._country_pos = {name: i for i, name in enumerate(self.countries)}
+
+    @classmethod
+    def from_frame(cls, df, ascending=False):
+        """Ranks a wide (year x country) DataFrame, highest first by default."""
+        values = df.to_numpy(dtype=np.float64)
+        key = hashlib.sha1(
+            values.tobytes()
+            + repr((list(df.index), list(df.columns), ascending)).encode()
+        ).hexdigest()
+        if key not in _rankings:
+            ranks, totals = rank_values(values, ascending)
+            _rankings[key] = cls(ranks, totals, df.index, df.columns)
+        return _rankings[key]
+
+    @classmethod
+    def from_results(
+        cls, df, country, year="Year", rank="Rank", total="Total_Countries"
+    ):
+        """
+        Wraps a country's published (year, rank, total) results, for contests
+        where only its rank is known rather than every entrant's score.
+        """
+        key = hashlib.sha1(
+            df[[year, rank, total]].to_numpy(dtype=np.int64).tobytes()
+            + repr(country).encode()
+        ).hexdigest()
+        if key not in _rankings:
+            _rankings[key] = cls(
+                df[rank].to_numpy(dtype=np.int16)[:, np.newaxis],
+                df[total].to_numpy(dtype=np.int16),
+                df[year],
+                [country],
+            )
+        return _rankings[key]
+
+    @classmethod
+    def from_panel(cls, panel, indicator="value", ascending=False):
+        return cls.from_frame(panel.frame(indicator), ascending)
+
+    def rank(self, country, year):
+        """Returns a country's rank in a year, or 0 if it was not ranked."""
+        return int(self.ranks[self._year_pos[year], self._country_pos[country]])
+
+    def percentiles(self):
+        """Returns the (year x country) percentiles, NaN where unranked."""
+        ranks = np.where(self.ranks > 0, self.ranks, np.nan)
+        return percentile(ranks, self.totals[:, np.newaxis].astype(np.float64))
+
+    def history(self, country):
+        """
+        Returns one country's Year, Rank, Total_Countries and Percentile for
+        every year it was ranked.
+        """
+        ranks = self.ranks[:, self._country_pos[country]]
+        ranked = ranks > 0
+        df = pd.DataFrame(
+            {
+                "Year": self.years[ranked],
+                "Rank": ranks[ranked],
+                "Total_Countries": self.totals[ranked],
+            }
+        )
+        df["Percentile"] = percentile(df["Rank"], df["Total_Countries"])
+        return df
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+
+class RatioCube:
+    """
+    The (year x numerator x denominator) cube of pairwise ratios of one
+    indicator, e.g. "X times richer than Y" for every pair of countries.
+
+    Nothing is computed up front: pair() divides one pair and against()
+    one denominator column, and each result is memoized, so a chart that
+    needs three pairs out of a G20 group computes three columns, not 400.
+    """
+
+    def __init__(self, values, years, countries):
+        self.values = np.asarray(values, dtype=np.float64)
+        self.years = pd.Index(years, name="Year")
+        self.countries = pd.Index(countries, name="Country")
+        self._pos = {name: i for i, name in enumerate(self.countries)}
+        self._pairs = {}
+        self._against = {}
+
+    @classmethod
+    def from_frame(cls, df):
+        """Builds a cube over a wide (year x country) DataFrame."""
+        return cls(df.to_numpy(dtype=np.float64), df.index, df.columns)
+
+    @classmethod
+    def from_panel(cls, panel, indicator="value"):
+        """Builds a cube over one indicator of a Panel, sharing its memory."""
+        return cls(panel.indicator(indicator), panel.years, list(panel.countries))
+
+    def pair(self, numerator, denominator):
+        """Returns numerator / denominator for every year as an array."""
+        key = (numerator, denominator)
+        if key not in self._pairs:
+            if denominator in self._against:
+                ratio = self._against[denominator][:, self._pos[numerator]]
+            else:
+                ratio = (
+                    self.values[:, self._pos[numerator]]
+                    / self.values[:, self._pos[denominator]]
+                )
+            ratio.flags.writeable = False
+            self._pairs[key] = ratio
+        return self._pairs[key]
+
+    def series(self, numerator, denominator):
+        """Returns numerator / denominator as a year-indexed Series."""
+        return pd.Series(
+            self.pair(numerator, denominator),
+            index=self.years,
+            name=f"{numerator}/{denominator}",
+            copy=False,
+        )
+
+    def against(self, denominator):
+        """Returns every country divided by denominator, as (year x country)."""
+        if denominator not in self._against:
+            pos = self._pos[denominator]
+            block = self.values / self.values[:, pos : pos + 1]
+            block.flags.writeable = False
+            self._against[denominator] = block
+        return self._against[denominator]
+
+    def cube(self):
+        """Returns the full (year x numerator x denominator) cube."""
+        return np.stack([self.against(c) for c in self.countries], axis=2)
@@ -0,0 +1,404 @@
+import hashlib
+import math
+import multiprocessing
+import os
+import subprocess
+import sys
+
+import matplotlib as mpl
+from matplotlib.animation import adjusted_figsize
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.transforms import Bbox
+
+# Frames are rendered by this many processes; 1 renders them in-process.
+# Parallel rendering needs fork() (so workers inherit the figure), which is
+# only used on Linux.
+WORKERS = int(os.environ.get("RENDER_WORKERS", os.cpu_count() or 1))
+# Upper bound on frames per task, which bounds how many rendered frames a
+# worker holds in memory before handing them back.
+MAX_CHUNK_SIZE = 16
+
+# The animation being rendered, inherited by forked workers, and each
+# worker's canvas and the index of the next frame it has to update.
+_job = None
+_worker_canvas = None
+_worker_next = 0
+
+
+def _can_fork():
+    return sys.platform.startswith("linux") and (
+        "fork" in multiprocessing.get_all_start_methods()
+    )
+
+
+def prepare_figure(fig, dpi=None, codec="h264"):
+    """
+    For h264 (which needs even dimensions), rounds the figure's size at the
+    output dpi the way matplotlib's movie writers do. Returns the output
+    dpi and the frame size in pixels.
+    """
+    dpi = fig.dpi if dpi is None else dpi
+    width, height = fig.get_size_inches()
+    if codec == "h264":
+        width, height = adjusted_figsize(width, height, dpi, 2)
+        fig.set_size_inches(width, height, forward=True)
+    return dpi, (int(round(width * dpi)), int(round(height * dpi)))
+
+
+def encoder_args(path, frame_size, fps, codec="h264", bitrate=-1, metadata=None):
+    """The ffmpeg command line for RGBA frames piped in at frame_size."""
+    args = [
+        mpl.rcParams["animation.ffmpeg_path"],
+        "-f",
+        "rawvideo",
+        "-vcodec",
+        "rawvideo",
+        "-s",
+        "%dx%d" % frame_size,
+        "-pix_fmt",
+        "rgba",
+        "-framerate",
+        str(fps),
+        "-loglevel",
+        "error",
+        "-i",
+        "pipe:",
+        "-vcodec",
+        codec,
+    ]
+    if codec == "h264":
+        args += ["-pix_fmt", "yuv420p"]
+    if bitrate > 0:
+        args += ["-b", "%dk" % bitrate]
+    for key, value in (metadata or {}).items():
+        args += ["-metadata", f"{key}={value}"]
+    return args + ["-y", path]
+
+
+class FFmpegSink:
+    """
+    A running ffmpeg process that encodes raw RGBA frames written to its
+    stdin. The pipe is unbuffered, so a frame handed over as a memoryview
+    (such as an Agg canvas's buffer_rgba()) goes straight from the
+    renderer's buffer to the pipe without being copied or converted.
+
+    Use as a context manager; leaving it closes the pipe and waits for
+    ffmpeg, raising RuntimeError if it failed.
+    """
+
+    def __init__(self, path, frame_size, fps, codec="h264", bitrate=-1, metadata=None):
+        self.frame_bytes = frame_size[0] * frame_size[1] * 4
+        self._encoder = subprocess.Popen(
+            encoder_args(path, frame_size, fps, codec, bitrate, metadata),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+        )
+
+    def write(self, frame, repeat=1):
+        """
+        Writes one frame, any buffer of exactly frame_bytes RGBA bytes,
+        repeat times in a row (a held frame is only rendered once).
+        """
+        frame = memoryview(frame).cast("B")
+        if frame.nbytes != self.frame_bytes:
+            raise ValueError(
+                f"Frame has {frame.nbytes} bytes, expected {self.frame_bytes}"
+            )
+        for _ in range(repeat):
+            # An unbuffered pipe may accept only part of a frame per write.
+            view = frame
+            while view:
+                view = view[self._encoder.stdin.write(view) :]
+
+    def close(self):
+        encoder = self._encoder
+        try:
+            encoder.stdin.close()
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its error is reported below
+        errors = encoder.stderr.read()
+        encoder.stderr.close()
+        if encoder.wait() != 0:
+            raise RuntimeError(
+                f"ffmpeg exited with status {encoder.returncode}: "
+                f"{errors.decode(errors='replace').strip()}"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _saving_canvas(fig):
+    """
+    Attaches an Agg canvas to fig that draws like Animation.save does,
+    including artists FuncAnimation(blit=True) has marked as animated.
+    """
+    canvas = FigureCanvasAgg(fig)
+    canvas._is_saving = True
+    return canvas
+
+
+def _grab(canvas, dpi):
+    """
+    Draws the figure at dpi, leaving the figure's own dpi in place for
+    update() the way savefig does, and returns a view of the canvas's
+    RGBA buffer, valid until the next draw.
+    """
+    fig = canvas.figure
+    figure_dpi = fig.dpi
+    fig.dpi = dpi
+    try:
+        canvas.draw()
+    finally:
+        fig.dpi = figure_dpi
+    return canvas.buffer_rgba()
+
+
+def _initialize(update, frames, init):
+    # Like FuncAnimation, draw the first frame as the initial one if there
+    # is no init function.
+    if init is not None:
+        init()
+    elif frames:
+        update(frames[0])
+
+
+def _render_chunk(bounds):
+    """
+    Renders frames[start:stop] of the inherited job in a worker. A worker
+    gets its chunks in increasing order and first brings its copy of the
+    figure up to start by running update() on every frame it has not seen,
+    without drawing them, since frames may depend on anything earlier
+    frames left behind (labels they added, cached annotations).
+    """
+    global _worker_canvas, _worker_next
+    start, stop = bounds
+    fig, update, frames, init, dpi = _job
+    if _worker_canvas is None:
+        _worker_canvas = _saving_canvas(fig)
+        _initialize(update, frames, init)
+        _worker_next = 0
+    for frame in frames[_worker_next:start]:
+        update(frame)
+    rendered = []
+    for frame in frames[start:stop]:
+        update(frame)
+        rendered.append(bytes(_grab(_worker_canvas, dpi)))
+    _worker_next = stop
+    return rendered
+
+
+def _tick_labels(fig):
+    return tuple(
+        (
+            tuple(ax.get_xticks()),
+            tuple(ax.get_yticks()),
+            tuple(label.get_text() for label in ax.get_xticklabels()),
+            tuple(label.get_text() for label in ax.get_yticklabels()),
+        )
+        for ax in fig.axes
+    )
+
+
+def freeze_layout(fig, update, frames, init=None, **layout_kwargs):
+    """
+    Lays the figure out once for a whole animation instead of calling
+    tight_layout in every frame. Steps through frames with update() and
+    runs fig.tight_layout(**layout_kwargs) on each frame whose tick labels
+    differ from the previous frame's, then pins every axes to the
+    innermost position any of them needed. The widest labels of the
+    animation all fit and the axes do not jitter from frame to frame.
+    """
+    frames = list(frames)
+    _initialize(update, frames, init)
+    boxes = {ax: [] for ax in fig.axes}
+    previous_labels = None
+    for frame in frames:
+        update(frame)
+        labels = _tick_labels(fig)
+        if labels == previous_labels:
+            continue
+        previous_labels = labels
+        fig.tight_layout(**layout_kwargs)
+        for ax, positions in boxes.items():
+            positions.append(ax.get_position().extents)
+    for ax, positions in boxes.items():
+        lefts, bottoms, rights, tops = zip(*positions)
+        ax.set_position(
+            Bbox.from_extents(max(lefts), max(bottoms), min(rights), min(tops))
+        )
+
+
+def hold_runs(frames, hold=None):
+    """
+    Splits frames into runs of consecutive frames that hold(frame) maps to
+    the same key, e.g. the pause frames at the end of an animation that
+    all show its last data point. Returns the first frame of each run and
+    the run lengths. Without hold every frame is its own run.
+    """
+    frames = list(frames)
+    if hold is None:
+        return frames, [1] * len(frames)
+    firsts, counts = [], []
+    previous_key = object()
+    for frame in frames:
+        key = hold(frame)
+        if counts and key == previous_key:
+            counts[-1] += 1
+        else:
+            firsts.append(frame)
+            counts.append(1)
+        previous_key = key
+    return firsts, counts
+
+
+def render_frames(fig, update, frames, init=None, dpi=None, workers=None):
+    """
+    Yields every frame as raw RGBA pixels drawn at dpi (default: the
+    figure's), in order: init() once, then update(frame) and a draw per
+    frame, like FuncAnimation.save. Serially rendered frames are views of
+    the canvas buffer, valid only until the next frame is requested.
+
+    With workers > 1 the frame range is split into chunks rendered by a
+    pool of forked processes, each drawing its own copy of the figure,
+    and the chunks are merged back in order. Every worker runs update() on
+    all frames before its chunks, so update() may rely on any state left
+    by earlier frames. Either way the frames are identical to rendering
+    serially.
+    """
+    global _job
+    frames = list(frames)
+    dpi = fig.dpi if dpi is None else dpi
+    workers = min(WORKERS if workers is None else workers, len(frames))
+    previous_canvas = fig.canvas
+    try:
+        if workers <= 1 or not _can_fork():
+            canvas = _saving_canvas(fig)
+            _initialize(update, frames, init)
+            for frame in frames:
+                update(frame)
+                yield _grab(canvas, dpi)
+            return
+
+        chunk_size = min(math.ceil(len(frames) / (workers * 4)), MAX_CHUNK_SIZE)
+        chunks = [
+            (start, min(start + chunk_size, len(frames)))
+            for start in range(0, len(frames), chunk_size)
+        ]
+        _job = (fig, update, frames, init, dpi)
+        with multiprocessing.get_context("fork").Pool(workers) as pool:
+            for rendered in pool.imap(_render_chunk, chunks):
+                yield from rendered
+    finally:
+        _job = None
+        fig.set_canvas(previous_canvas)
+
+
+def save(
+    fig,
+    update,
+    frames,
+    path,
+    fps,
+    init=None,
+    dpi=None,
+    codec="h264",
+    bitrate=-1,
+    metadata=None,
+    workers=None,
+    hold=None,
+):
+    """
+    Renders an animation (see render_frames) and encodes it to path with
+    ffmpeg, taking the same options as matplotlib's ffmpeg writer.
+    Raises FileNotFoundError if ffmpeg is missing and RuntimeError if it
+    fails.
+
+    hold maps a frame to the data it shows. Consecutive frames with the
+    same key must look identical: only the first is rendered, and the
+    encoder is sent that frame again for the rest (see hold_runs).
+    """
+    dpi, frame_size = prepare_figure(fig, dpi, codec)
+    frames, counts = hold_runs(frames, hold)
+    with FFmpegSink(path, frame_size, fps, codec, bitrate, metadata) as sink:
+        rendered = render_frames(fig, update, frames, init, dpi, workers)
+        for frame, count in zip(rendered, counts):
+            sink.write(frame, count)
+
+
+def mismatched_frames(
+    fig, update, frames, init=None, dpi=None, workers=None, hold=None
+):
+    """
+    Renders frames the way save does, in parallel and rendering each hold
+    run once, then renders every frame serially and returns the indices of
+    the frames that differ. The parallel pass goes first because only its
+    workers' copies of the figure are updated; the serial pass then starts
+    from the same untouched figure.
+    """
+    frames = list(frames)
+    firsts, counts = hold_runs(frames, hold)
+    workers = max(WORKERS if workers is None else workers, 2)
+    parallel = [
+        hashlib.sha1(frame).digest()
+        for frame, count in zip(
+            render_frames(fig, update, firsts, init, dpi, workers), counts
+        )
+        for _ in range(count)
+    ]
+    serial = [
+        hashlib.sha1(frame).digest()
+        for frame in render_frames(fig, update, frames, init, dpi, workers=1)
+    ]
+    return [i for i, (a, b) in enumerate(zip(parallel, serial)) if a != b]
+
+
+def _check_script(path):
+    """
+    Runs an animation script with render.save replaced by a comparison of
+    the frames it would encode with serially rendered ones (see
+    mismatched_frames). Returns True if they all match.
+    """
+    import runpy
+
+    import matplotlib.pyplot as plt
+
+    from common import render
+
+    results = []
+
+    def check(fig, update, frames, path, fps, init=None, dpi=None, **kwargs):
+        frames = list(frames)
+        dpi, _ = prepare_figure(fig, dpi, kwargs.get("codec", "h264"))
+        mismatched = mismatched_frames(
+            fig, update, frames, init, dpi, hold=kwargs.get("hold")
+        )
+        results.append((path, len(frames), mismatched))
+
+    save, render.save = render.save, check
+    try:
+        runpy.run_path(path, run_name="__main__")
+    finally:
+        render.save = save
+        plt.close("all")
+    for output, count, mismatched in results:
+        status = f"{len(mismatched)} differ: {mismatched}" if mismatched else "ok"
+        print(f"{path} -> {output}: {count} frames, {status}")
+    return all(not mismatched for _, _, mismatched in results)
+
+
+if __name__ == "__main__":
+    # python -m common.render SCRIPT... (from scripts/) checks that parallel
+    # rendering and held frames reproduce the serial frames of each animation.
+    # The check runs in the importable module, whose functions the worker
+    # processes can look up.
+    from common.render import _check_script
+
+    mpl.use("Agg")
+    ok = [_check_script(path) for path in sys.argv[1:]]
+    sys.exit(0 if all(ok) else 1)
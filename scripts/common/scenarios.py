@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+
+# Scenarios are simulated in batches of this many paths, which bounds memory
+# at roughly batch x years x regions float64 values per array.
+BATCH_SIZE = 10_000
+
+
+# --- Parameter distributions ---
+#
+# A scenario parameter is either a fixed number or one of these callables,
+# which draw n values from a numpy Generator.
+
+
+def normal(mean, sd):
+    return lambda rng, n: rng.normal(mean, sd, n)
+
+
+def lognormal(median, sigma):
+    return lambda rng, n: median * rng.lognormal(0.0, sigma, n)
+
+
+def uniform(low, high):
+    return lambda rng, n: rng.uniform(low, high, n)
+
+
+def _draw(param, rng, n):
+    if callable(param):
+        return np.asarray(param(rng, n), dtype=np.float64)
+    return np.full(n, param, dtype=np.float64)
+
+
+def draw(spec, n, seed=None):
+    """
+    Draws n scenarios from spec: {region: (start value, growth rate)}, where
+    either entry may be a distribution. Returns (regions, start_values,
+    growth_rates) with both arrays shaped (n x regions).
+    """
+    rng = np.random.default_rng(seed)
+    regions = list(spec)
+    start_values = np.column_stack([_draw(spec[r][0], rng, n) for r in regions])
+    growth_rates = np.column_stack([_draw(spec[r][1], rng, n) for r in regions])
+    return regions, start_values, growth_rates
+
+
+# --- Decay schedules ---
+
+
+def tiered_decay(tiers):
+    """
+    Returns a decay step that lowers every rate by the decrement of the first
+    (threshold, decrement) tier it is at or above, and leaves rates below
+    every threshold alone. Tiers are checked in order, highest first.
+    """
+    thresholds = np.array([t for t, _ in tiers], dtype=np.float64)
+    decrements = np.array([d for _, d in tiers] + [0.0], dtype=np.float64)
+
+    def step(rates, scale=1.0):
+        # Index of the first tier each rate qualifies for; len(tiers) if none.
+        tier = np.argmax(rates[..., np.newaxis] >= thresholds, axis=-1)
+        tier[rates < thresholds.min()] = len(tiers)
+        return rates - decrements[tier] * np.asarray(scale)[..., np.newaxis]
+
+    return step
+
+
+# --- Simulation ---
+
+
+def growth_paths(rates, n_years, decay=None, decay_every=10, decay_scale=1.0):
+    """
+    Returns the (scenarios x years x regions) growth rate applied in each
+    year after the start. Every decay_every years the rates are lowered by
+    decay, optionally scaled per scenario by decay_scale.
+    """
+    rates = np.array(rates, dtype=np.float64)
+    paths = np.empty((rates.shape[0], n_years, rates.shape[1]))
+    for block_start in range(0, n_years, decay_every):
+        paths[:, block_start : block_start + decay_every] = rates[:, np.newaxis]
+        if decay is not None:
+            rates = decay(rates, decay_scale)
+    return paths
+
+
+def simulate(start_values, growth_rates, n_years, **decay_kwargs):
+    """
+    Projects every scenario n_years ahead at once. start_values and
+    growth_rates are (scenarios x regions); the result is (scenarios x
+    n_years + 1 x regions), with the start values as the first year.
+    """
+    start_values = np.asarray(start_values, dtype=np.float64)
+    log_growth = np.log1p(growth_paths(growth_rates, n_years, **decay_kwargs))
+    log_values = np.empty((start_values.shape[0], n_years + 1, start_values.shape[1]))
+    log_values[:, 0] = np.log(start_values)
+    np.cumsum(log_growth, axis=1, out=log_values[:, 1:])
+    log_values[:, 1:] += log_values[:, :1]
+    return np.exp(log_values)
+
+
+def _first_overtakes(values, start_year):
+    """
+    For each ordered (winner, loser) pair, returns the (scenarios x pairs)
+    year in which winner first moves from below to at or above loser,
+    linearly interpolated between years; NaN where it never does.
+    """
+    n_regions = values.shape[2]
+    winner, loser = np.nonzero(~np.eye(n_regions, dtype=bool))
+    diff = values[:, :, winner] - values[:, :, loser]  # (scenario x year x pair)
+    overtakes = (diff[:, 1:] >= 0) & (diff[:, :-1] < 0)
+    step_before = overtakes.argmax(axis=1)  # (scenario x pair)
+    found = overtakes.any(axis=1)
+
+    d_before = np.take_along_axis(diff, step_before[:, np.newaxis], axis=1)[:, 0]
+    d_after = np.take_along_axis(diff, step_before[:, np.newaxis] + 1, axis=1)[:, 0]
+    years = start_year + step_before + d_before / (d_before - d_after)
+    return np.where(found, years, np.nan), winner, loser
+
+
+def convergence_years(
+    regions,
+    start_values,
+    growth_rates,
+    start_year,
+    end_year,
+    batch_size=BATCH_SIZE,
+    **decay_kwargs,
+):
+    """
+    Simulates every scenario from start_year to end_year and returns a
+    DataFrame with one row per scenario and one (winner, loser) column per
+    ordered pair of regions, holding the (fractional) year winner first
+    overtakes loser, or NaN if it does not within the horizon.
+
+    decay_kwargs are passed to growth_paths; a per-scenario decay_scale
+    array is split into batches along with the scenarios.
+    """
+    start_values = np.asarray(start_values, dtype=np.float64)
+    growth_rates = np.asarray(growth_rates, dtype=np.float64)
+    n_scenarios = start_values.shape[0]
+    decay_scale = np.broadcast_to(
+        np.asarray(decay_kwargs.pop("decay_scale", 1.0), dtype=np.float64),
+        (n_scenarios,),
+    )
+
+    batches = []
+    for lo in range(0, n_scenarios, batch_size):
+        hi = min(lo + batch_size, n_scenarios)
+        values = simulate(
+            start_values[lo:hi],
+            growth_rates[lo:hi],
+            end_year - start_year,
+            decay_scale=decay_scale[lo:hi],
+            **decay_kwargs,
+        )
+        years, winner, loser = _first_overtakes(values, start_year)
+        batches.append(years)
+
+    labels = np.asarray(regions, dtype=object)
+    columns = pd.MultiIndex.from_arrays(
+        [labels[winner], labels[loser]], names=["winner", "loser"]
+    )
+    return pd.DataFrame(np.concatenate(batches), columns=columns, copy=False)
+
+
+def summarize(years, quantiles=(0.05, 0.25, 0.5, 0.75, 0.95)):
+    """
+    Summarizes a convergence_years() frame: for every pair, the share of
+    scenarios in which the overtake happens, and quantiles of its year among
+    those scenarios. Pairs that never happen in any scenario are dropped.
+    """
+    summary = years.quantile(list(quantiles)).T
+    summary.columns = [f"p{round(q * 100)}" for q in quantiles]
+    summary.insert(0, "share", years.notna().mean())
+    return summary[summary["share"] > 0]
@@ -0,0 +1,76 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+MODES = ("linear", "log", "eased")
+
+_tweens = {}
+
+
+def frame_count(n_steps, frames_per_step=None, fps=None, duration=None):
+    """
+    Number of frames spanning n_steps data points: either frames_per_step
+    frames between consecutive points (plus the final point), or
+    fps * duration frames in total.
+    """
+    if frames_per_step is not None:
+        return (n_steps - 1) * frames_per_step + 1
+    if fps is None or duration is None:
+        raise ValueError("pass frames_per_step, or both fps and duration")
+    return max(int(round(fps * duration)), 2)
+
+
+def _ease(fraction):
+    # Smoothstep: starts and ends every step at zero speed.
+    return fraction * fraction * (3 - 2 * fraction)
+
+
+def tween(values, times=None, mode="linear", **frame_kwargs):
+    """
+    Resamples a (time x country) panel onto evenly spaced animation frames.
+
+    values is an array or a wide DataFrame (whose index, if numeric, gives
+    the times; otherwise steps are evenly spaced). The frame count comes
+    from frame_count(len(values), **frame_kwargs). Between data points the
+    values are interpolated:
+
+    - "linear": straight lines,
+    - "log": straight lines in log space (constant growth within a step),
+    - "eased": linear, but easing in and out of every data point.
+
+    Returns (frame_times, frames): frame times and a contiguous, read-only
+    (frames x country) float64 array. Results are cached by their inputs.
+    """
+    if mode not in MODES:
+        raise ValueError(f"unknown mode {mode!r}; expected one of {MODES}")
+    if isinstance(values, pd.DataFrame):
+        if times is None and pd.api.types.is_numeric_dtype(values.index):
+            times = values.index.to_numpy()
+        values = values.to_numpy(dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    times = np.arange(len(values)) if times is None else np.asarray(times)
+    times = times.astype(np.float64)
+    n_frames = frame_count(len(values), **frame_kwargs)
+
+    key = hashlib.sha1(
+        values.tobytes() + times.tobytes() + f"{n_frames}:{mode}".encode()
+    ).hexdigest()
+    if key not in _tweens:
+        frame_times = np.linspace(times[0], times[-1], n_frames)
+        step = np.clip(np.searchsorted(times, frame_times, side="right") - 1, 0, None)
+        step = np.minimum(step, len(times) - 2)
+        fraction = (frame_times - times[step]) / (times[step + 1] - times[step])
+        if mode == "eased":
+            fraction = _ease(fraction)
+        if mode == "log":
+            values = np.log(values)
+        start, end = values[step], values[step + 1]
+        frames = start + fraction[:, np.newaxis] * (end - start)
+        if mode == "log":
+            frames = np.exp(frames)
+        frames = np.ascontiguousarray(frames)
+        frame_times.flags.writeable = False
+        frames.flags.writeable = False
+        _tweens[key] = (frame_times, frames)
+    return _tweens[key]
@@ -0,0 +1,88 @@
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Base URL of the World Bank v2 API. Overridable so fetches can be pointed at
+# a mirror or a local stand-in server.
+API_URL = os.environ.get("WB_API_URL", "https://api.worldbank.org/v2")
+
+# The API accepts semicolon-joined country lists; chunking keeps the URL well
+# under common proxy limits even for "all economies" pulls.
+MAX_COUNTRIES_PER_REQUEST = 60
+DEFAULT_PER_PAGE = 1000
+
+_session = None
+
+
+class WorldBankAPIError(RuntimeError):
+    """Raised when the World Bank API answers with an error payload."""
+
+
+def get_session():
+    """Returns the shared, connection-pooled requests.Session."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=2)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+
+def _get_pages(url, params, session):
+    """Yields the data rows of every page of a v2 API response."""
+    page = 1
+    while True:
+        response = session.get(url, params={**params, "page": page}, timeout=60)
+        response.raise_for_status()
+        payload = response.json()
+        if len(payload) < 2 or "message" in payload[0]:
+            raise WorldBankAPIError(f"{response.url}: {payload[0]}")
+        meta, rows = payload
+        yield from rows or []
+        if page >= int(meta.get("pages") or 1):
+            break
+        page += 1
+
+
+def fetch_records(
+    indicator, countries, start, end, per_page=DEFAULT_PER_PAGE, session=None
+):
+    """
+    Yields (code, country_name, year, value) for one indicator and many
+    countries, with one request per chunk of countries and pagination
+    followed. code is the one passed in (ISO2 or ISO3); value may be None.
+    """
+    countries = [countries] if isinstance(countries, str) else list(countries)
+    session = session or get_session()
+    lookup = {code.upper(): code for code in countries}
+
+    for i in range(0, len(countries), MAX_COUNTRIES_PER_REQUEST):
+        chunk = countries[i : i + MAX_COUNTRIES_PER_REQUEST]
+        url = f"{API_URL}/country/{';'.join(chunk)}/indicator/{indicator}"
+        params = {"format": "json", "date": f"{start}:{end}", "per_page": per_page}
+        for row in _get_pages(url, params, session):
+            code = lookup.get(row["countryiso3code"].upper()) or lookup.get(
+                row["country"]["id"].upper()
+            )
+            if code is not None:
+                yield code, row["country"]["value"], int(row["date"]), row["value"]
+
+
+def fetch_indicator(
+    indicator, countries, start, end, per_page=DEFAULT_PER_PAGE, session=None
+):
+    """
+    Fetches one indicator for many countries. Returns
+    {country_code: {year: value}} keyed by the codes passed in, skipping
+    missing values.
+    """
+    countries = [countries] if isinstance(countries, str) else list(countries)
+    result = {code: {} for code in countries}
+    for code, _, year, value in fetch_records(
+        indicator, countries, start, end, per_page=per_page, session=session
+    ):
+        if value is not None:
+            result[code][year] = value
+    return result
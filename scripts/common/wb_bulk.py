@@ -0,0 +1,121 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Converted copies of World Bank bulk "API_*_DS2_en_csv_v2.csv" downloads. Each
+# indicator becomes a directory with a (year x country) float64 matrix that is
+# memory-mapped on load, plus the country code/name axes. Storing it year-major
+# keeps each year's values contiguous, so loading a year reads only its pages.
+STORE_DIR = os.environ.get(
+    "WB_BULK_DIR",
+    os.path.join(os.path.dirname(__file__), "..", "..", "data", "wb_bulk"),
+)
+
+# Stores converted with a different matrix layout are converted again.
+LAYOUT = "year x country"
+
+_opened = {}
+
+
+def store_path(csv_path):
+    """Returns the store directory used for a bulk CSV file."""
+    name = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(STORE_DIR, name)
+
+
+def _source_stamp(csv_path):
+    stat = os.stat(csv_path)
+    return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def ingest(csv_path, force=False):
+    """
+    Converts a bulk DS2 CSV into the columnar store, unless an up-to-date
+    conversion already exists. Returns the store directory.
+    """
+    target = store_path(csv_path)
+    meta_path = os.path.join(target, "meta.json")
+    stamp = _source_stamp(csv_path)
+    if not force and os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+            if meta["source"] == stamp and meta.get("layout") == LAYOUT:
+                return target
+
+    df = pd.read_csv(csv_path, skiprows=4)
+    year_columns = [col for col in df.columns if str(col).isdigit()]
+    years = [int(col) for col in year_columns]
+
+    os.makedirs(target, exist_ok=True)
+    np.save(
+        os.path.join(target, "values.npy"),
+        np.ascontiguousarray(df[year_columns].to_numpy(dtype=np.float64).T),
+    )
+    np.save(os.path.join(target, "codes.npy"), df["Country Code"].to_numpy(dtype=str))
+    np.save(os.path.join(target, "names.npy"), df["Country Name"].to_numpy(dtype=str))
+    with open(meta_path, "w") as f:
+        json.dump(
+            {
+                "first_year": years[0],
+                "last_year": years[-1],
+                "indicator": str(df["Indicator Code"].iloc[0]),
+                "layout": LAYOUT,
+                "source": stamp,
+            },
+            f,
+        )
+    _opened.pop(target, None)
+    return target
+
+
+def open_indicator(csv_path):
+    """
+    Returns the ingested indicator as a dict with the memory-mapped "values"
+    matrix, the "codes"/"names" axes, a code -> column "index" and "first_year".
+    Ingests the CSV first if needed; repeat opens are served from memory.
+    """
+    target = ingest(csv_path)
+    if target not in _opened:
+        with open(os.path.join(target, "meta.json")) as f:
+            meta = json.load(f)
+        codes = np.load(os.path.join(target, "codes.npy"))
+        _opened[target] = {
+            "values": np.load(os.path.join(target, "values.npy"), mmap_mode="r"),
+            "codes": codes,
+            "names": np.load(os.path.join(target, "names.npy")),
+            "index": {code: col for col, code in enumerate(codes)},
+            "first_year": meta["first_year"],
+            "last_year": meta["last_year"],
+        }
+    return _opened[target]
+
+
+def lookup(csv_path, country_code, year):
+    """Returns a single (country code, year) cell, or NaN if it is absent."""
+    indicator = open_indicator(csv_path)
+    col = indicator["index"].get(country_code)
+    row = int(year) - indicator["first_year"]
+    if col is None or not 0 <= row <= indicator["last_year"] - indicator["first_year"]:
+        return np.nan
+    return float(indicator["values"][row, col])
+
+
+def load_columns(csv_path, years):
+    """
+    Returns the same frame as reading the bulk CSV and keeping
+    ["Country Name", "Country Code", *years], touching only those years' rows
+    of the store. Raises KeyError for a year the CSV has no column for.
+    """
+    indicator = open_indicator(csv_path)
+    rows = [int(year) - indicator["first_year"] for year in years]
+    for year, row in zip(years, rows):
+        if not 0 <= row <= indicator["last_year"] - indicator["first_year"]:
+            raise KeyError(f"No {year} column in {csv_path}")
+    df = pd.DataFrame(
+        {"Country Name": indicator["names"], "Country Code": indicator["codes"]}
+    )
+    for year, row in zip(years, rows):
+        df[str(year)] = np.asarray(indicator["values"][row])
+    return df
@@ -0,0 +1,213 @@
+import contextlib
+import datetime
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: stores are only locked within one process
+    fcntl = None
+
+import pandas as pd
+
+from common import wb_api
+
+# Cached World Bank downloads live next to the other datasets, but are not
+# committed. Both locations can be overridden from the environment so the
+# nightly gallery rebuild can share one cache across checkouts.
+CACHE_DIR = os.environ.get(
+    "WB_CACHE_DIR",
+    os.path.join(os.path.dirname(__file__), "..", "..", "data", "wb_cache"),
+)
+OFFLINE = os.environ.get("WB_OFFLINE", "") not in ("", "0", "false", "False")
+
+ROW_COLUMNS = ["code", "country", "year", "value"]
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+class CacheMiss(LookupError):
+    """Raised in offline mode when a request is not already cached."""
+
+
+def normalize_countries(country):
+    """Returns a sorted, upper-cased tuple of country codes."""
+    if isinstance(country, str):
+        country = [country]
+    return tuple(sorted(code.upper() for code in country))
+
+
+def cache_path(indicator):
+    """Returns the cache file holding every stored series of an indicator."""
+    return os.path.join(CACHE_DIR, f"{indicator}.pkl")
+
+
+def _lock_for(indicator):
+    with _locks_guard:
+        return _locks.setdefault(indicator, threading.Lock())
+
+
+@contextlib.contextmanager
+def _locked(indicator):
+    """
+    Holds an indicator's store for a read-modify-write: a thread lock within
+    this process and an flock on a sidecar file across processes, so
+    concurrent refreshes (e.g. the nightly rebuild) cannot drop each other's
+    series.
+    """
+    with _lock_for(indicator):
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(f"{cache_path(indicator)}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _load_store(indicator):
+    """
+    An indicator's store is a dict with the long-format "rows" frame and the
+    "coverage" {code: (first_year, last_year)} requested so far, so years the
+    World Bank has no value for are not asked for again on every run.
+    """
+    path = cache_path(indicator)
+    if os.path.exists(path):
+        return pd.read_pickle(path)
+    return {"rows": pd.DataFrame(columns=ROW_COLUMNS), "coverage": {}}
+
+
+def _save_store(indicator, store):
+    rows = store["rows"].astype(
+        {"code": "category", "country": "category", "year": "int16"}
+    )
+    store = {"rows": rows.reset_index(drop=True), "coverage": store["coverage"]}
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = cache_path(indicator)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    pd.to_pickle(store, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _last_valid_years(store):
+    rows = store["rows"].dropna(subset=["value"])
+    return rows.groupby("code", observed=True)["year"].max().astype(int).to_dict()
+
+
+def last_years(indicator):
+    """Returns {code: last year with a non-missing value} for a stored indicator."""
+    return _last_valid_years(_load_store(indicator))
+
+
+def _fetch_into(store, indicator, ranges):
+    """
+    Fetches {(first_year, last_year): [codes]} with one batched request per
+    range and merges the results into store. Returns the number of new
+    non-missing values.
+    """
+    fetched = []
+    for (first_year, last_year), codes in ranges.items():
+        fetched.extend(
+            wb_api.fetch_records(indicator, list(codes), first_year, last_year)
+        )
+        for code in codes:
+            lo, hi = store["coverage"].get(code, (first_year, last_year))
+            store["coverage"][code] = (min(lo, first_year), max(hi, last_year))
+
+    new_rows = pd.DataFrame(fetched, columns=ROW_COLUMNS)
+    merged = pd.concat(
+        [store["rows"].astype(object), new_rows.astype(object)], ignore_index=True
+    )
+    store["rows"] = merged.drop_duplicates(subset=["code", "year"], keep="last")
+    return int(new_rows["value"].notna().sum())
+
+
+def _missing_ranges(store, valid_until, code, start, end, refresh):
+    covered = store["coverage"].get(code)
+    if covered is None:
+        return [(start, end)]
+    lo, hi = covered
+    ranges = []
+    if start < lo:
+        ranges.append((start, lo - 1))
+    tail_from = hi + 1
+    if refresh:
+        tail_from = min(tail_from, valid_until.get(code, lo - 1) + 1)
+    tail_from = max(tail_from, start)
+    if tail_from <= end:
+        ranges.append((tail_from, end))
+    return ranges
+
+
+def download(indicator, country, start, end, offline=None, refresh=False):
+    """
+    Drop-in replacement for pandas_datareader.wb.download with a disk cache.
+    Series are stored per (indicator, country) pair, so only years that were
+    never requested go over the network; refresh=True also re-requests the
+    years after each series' last known value. With offline=True (or
+    WB_OFFLINE=1) the network is never touched and a CacheMiss is raised for
+    anything not cached yet.
+    """
+    offline = OFFLINE if offline is None else offline
+    codes = normalize_countries(country)
+
+    with _locked(indicator):
+        store = _load_store(indicator)
+        valid_until = _last_valid_years(store) if refresh else {}
+        ranges = {}
+        for code in codes:
+            for years in _missing_ranges(store, valid_until, code, start, end, refresh):
+                ranges.setdefault(years, []).append(code)
+
+        if ranges:
+            if offline:
+                missing = sorted({code for group in ranges.values() for code in group})
+                raise CacheMiss(
+                    f"{indicator} for {', '.join(missing)} ({start}-{end}) "
+                    f"is not cached in {CACHE_DIR}"
+                )
+            _fetch_into(store, indicator, ranges)
+            _save_store(indicator, store)
+
+    rows = store["rows"]
+    rows = rows[
+        rows["code"].isin(codes) & rows["year"].astype(int).between(start, end)
+    ].sort_values(["country", "year"], ascending=[True, False])
+    return pd.DataFrame(
+        {indicator: rows["value"].astype(float).to_numpy()},
+        index=pd.MultiIndex.from_arrays(
+            [rows["country"].astype(str), rows["year"].astype(str)],
+            names=["country", "year"],
+        ),
+    )
+
+
+def refresh(indicator, country=None, end=None):
+    """
+    Brings stored series up to date by requesting only the years after each
+    series' last known value, batched across countries with the same gap.
+    country defaults to every stored series and end to the current year.
+    Returns the number of new values.
+    """
+    end = end or datetime.date.today().year
+    with _locked(indicator):
+        store = _load_store(indicator)
+        stored = store["coverage"]
+        codes = normalize_countries(country) if country else sorted(stored)
+        valid_until = _last_valid_years(store)
+        ranges = {}
+        for code in codes:
+            if code not in stored:
+                continue
+            tail_from = valid_until.get(code, stored[code][0] - 1) + 1
+            if tail_from <= end:
+                ranges.setdefault((tail_from, end), []).append(code)
+        if not ranges:
+            return 0
+        new_values = _fetch_into(store, indicator, ranges)
+        _save_store(indicator, store)
+    return new_values
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from common import wb_api, wb_cache
+
+# World Bank requests are I/O bound; a handful of workers keeps total latency
+# close to the slowest single request without hammering the API.
+MAX_WORKERS = 8
+
+_executor = None
+_executor_lock = threading.Lock()
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=MAX_WORKERS, thread_name_prefix="wb-fetch"
+            )
+    return _executor
+
+
+def _submit(key, fn, *args, **kwargs):
+    """
+    Submits fn to the shared pool unless an identical request is already
+    running, in which case the caller gets the existing Future.
+    """
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        if future is not None:
+            return future
+        future = _get_executor().submit(fn, *args, **kwargs)
+        _in_flight[key] = future
+
+    def _forget(done):
+        with _in_flight_lock:
+            if _in_flight.get(key) is done:
+                del _in_flight[key]
+
+    future.add_done_callback(_forget)
+    return future
+
+
+def submit_download(indicator, country, start, end, **kwargs):
+    """Non-blocking wb_cache.download; returns a concurrent.futures.Future."""
+    countries = wb_cache.normalize_countries(country)
+    key = ("download", indicator, countries, start, end, tuple(sorted(kwargs.items())))
+    return _submit(
+        key, wb_cache.download, indicator, list(countries), start, end, **kwargs
+    )
+
+
+def submit_indicator(indicator, countries, start, end, **kwargs):
+    """Non-blocking wb_api.fetch_indicator; returns a concurrent.futures.Future."""
+    countries = [countries] if isinstance(countries, str) else list(countries)
+    key = (
+        "indicator",
+        indicator,
+        tuple(countries),
+        start,
+        end,
+        tuple(sorted(kwargs.items())),
+    )
+    return _submit(
+        key, wb_api.fetch_indicator, indicator, countries, start, end, **kwargs
+    )
+
+
+def download(indicator, country, start, end, **kwargs):
+    """Same call as wb_cache.download, coalesced with identical in-flight calls."""
+    return submit_download(indicator, country, start, end, **kwargs).result()
+
+
+def fetch_indicator(indicator, countries, start, end, **kwargs):
+    """Same call as wb_api.fetch_indicator, coalesced with identical in-flight calls."""
+    return submit_indicator(indicator, countries, start, end, **kwargs).result()
+
+
+def download_many(indicators, country, start, end, **kwargs):
+    """
+    Downloads several indicators concurrently and returns {indicator: DataFrame}.
+    Total latency is that of the slowest indicator rather than the sum.
+    """
+    futures = {
+        indicator: submit_download(indicator, country, start, end, **kwargs)
+        for indicator in indicators
+    }
+    return {indicator: future.result() for indicator, future in futures.items()}
+
+
+async def adownload(indicator, country, start, end, **kwargs):
+    """Awaitable wb_cache.download for asyncio callers."""
+    return await asyncio.wrap_future(
+        submit_download(indicator, country, start, end, **kwargs)
+    )
+
+
+async def afetch_indicator(indicator, countries, start, end, **kwargs):
+    """Awaitable wb_api.fetch_indicator for asyncio callers."""
+    return await asyncio.wrap_future(
+        submit_indicator(indicator, countries, start, end, **kwargs)
+    )
@@ -0,0 +1,261 @@
+"""
+Local stand-in for the World Bank v2 API, for offline benchmarks and
+regression checks of the fetch layer.
+
+It answers /v2/country/<codes>/indicator/<indicator>?format=json&date=a:b
+with [meta, rows] pages like the real service, replaying series recorded
+with record() (or synthetic ones), with configurable latency and page size.
+
+    python scripts/common/wb_stub_server.py --latency 0.05 --page-size 50
+    python scripts/common/wb_stub_server.py --synthetic --bench
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from common import wb_api  # noqa: E402
+
+RECORDINGS_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "data", "wb_recordings"
+)
+
+# What the real API answers for an unknown indicator.
+INVALID_VALUE = [
+    {
+        "message": [
+            {
+                "id": "120",
+                "key": "Invalid value",
+                "value": "The provided parameter value is not valid",
+            }
+        ]
+    }
+]
+
+
+def record(indicator, countries, start, end, recordings_dir=RECORDINGS_DIR):
+    """
+    Fetches an indicator from the live API (or whatever wb_api.API_URL points
+    at) and merges the rows into <recordings_dir>/<indicator>.json.
+    """
+    path = os.path.join(recordings_dir, f"{indicator}.json")
+    rows = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            rows = {(r[0], r[2]): r for r in json.load(f)["rows"]}
+    for code, name, year, value in wb_api.fetch_records(
+        indicator, countries, start, end
+    ):
+        rows[(code.upper(), year)] = [code.upper(), name, year, value]
+    os.makedirs(recordings_dir, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"indicator": indicator, "rows": sorted(rows.values())}, f)
+    return path
+
+
+def _synthetic_rows(indicator, codes, start, end):
+    """Deterministic made-up series, for benchmarks that need no recording."""
+    rows = []
+    for code in codes:
+        base = 500 + sum(map(ord, code + indicator)) % 5000
+        for year in range(start, end + 1):
+            rows.append([code, f"Country {code}", year, base * 1.03 ** (year - 1960)])
+    return rows
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        time.sleep(server.latency)
+        with server.count_lock:
+            server.request_count += 1
+
+        url = urlparse(self.path)
+        parts = url.path.strip("/").split("/")
+        if parts[:1] == ["v2"]:
+            parts = parts[1:]
+        if len(parts) != 4 or parts[0] != "country" or parts[2] != "indicator":
+            self._send(404, [{"message": [{"id": "120", "value": "Invalid path"}]}])
+            return
+
+        codes = [code.upper() for code in parts[1].split(";")]
+        indicator = parts[3]
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        start, _, end = query.get("date", "1960:2100").partition(":")
+        start, end = int(start), int(end or start)
+
+        rows = server.rows_for(indicator, codes, start, end)
+        if rows is None:
+            self._send(200, INVALID_VALUE)
+            return
+
+        per_page = min(int(query.get("per_page", 50)), server.page_size)
+        page = int(query.get("page", 1))
+        pages = max(1, -(-len(rows) // per_page))
+        chunk = rows[(page - 1) * per_page : page * per_page]
+        meta = {
+            "page": page,
+            "pages": pages,
+            "per_page": per_page,
+            "total": len(rows),
+            "sourceid": "2",
+            "lastupdated": "stub",
+        }
+        self._send(200, [meta, [_to_api_row(indicator, row) for row in chunk]])
+
+
+def _to_api_row(indicator, row):
+    code, name, year, value = row
+    return {
+        "indicator": {"id": indicator, "value": indicator},
+        "country": {"id": code if len(code) == 2 else "", "value": name},
+        "countryiso3code": code if len(code) == 3 else "",
+        "date": str(year),
+        "value": value,
+        "unit": "",
+        "obs_status": "",
+        "decimal": 0,
+    }
+
+
+class StubServer(ThreadingHTTPServer):
+    """World Bank API stand-in; see the module docstring."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        port=0,
+        recordings_dir=RECORDINGS_DIR,
+        latency=0.0,
+        page_size=1000,
+        synthetic=False,
+    ):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.recordings_dir = recordings_dir
+        self.latency = latency
+        self.page_size = page_size
+        self.synthetic = synthetic
+        self.request_count = 0
+        self.count_lock = threading.Lock()
+        self._recordings = {}
+
+    @property
+    def api_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/v2"
+
+    def rows_for(self, indicator, codes, start, end):
+        """Returns matching rows, newest year first, or None for unknown indicators."""
+        if indicator not in self._recordings:
+            path = os.path.join(self.recordings_dir, f"{indicator}.json")
+            if os.path.exists(path):
+                with open(path) as f:
+                    self._recordings[indicator] = json.load(f)["rows"]
+            elif not self.synthetic:
+                return None
+        if indicator in self._recordings:
+            wanted = set(codes)
+            rows = [
+                row
+                for row in self._recordings[indicator]
+                if row[0] in wanted and start <= row[2] <= end
+            ]
+        else:
+            rows = _synthetic_rows(indicator, codes, start, end)
+        return sorted(rows, key=lambda row: (codes.index(row[0]), -row[2]))
+
+
+def start(**kwargs):
+    """Starts a StubServer on a background thread and returns it."""
+    server = StubServer(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _benchmark(server, countries=200, indicators=4, start_year=1960, end_year=2023):
+    from common import wb_fetcher
+
+    wb_api.API_URL = server.api_url
+    codes = [f"{chr(65 + i // 26)}{chr(65 + i % 26)}" for i in range(countries)]
+    names = [f"IND.{i}" for i in range(indicators)]
+
+    def timed(label, fn):
+        server.request_count = 0
+        began = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - began
+        print(f"{label:<34} {elapsed * 1000:9.1f} ms {server.request_count:6} requests")
+
+    timed(
+        "per-country requests",
+        lambda: [
+            wb_api.fetch_indicator(name, [code], start_year, end_year)
+            for name in names
+            for code in codes
+        ],
+    )
+    timed(
+        "batched, sequential indicators",
+        lambda: [
+            wb_api.fetch_indicator(name, codes, start_year, end_year) for name in names
+        ],
+    )
+    timed(
+        "batched, concurrent indicators",
+        lambda: [
+            future.result()
+            for future in [
+                wb_fetcher.submit_indicator(name, codes, start_year, end_year)
+                for name in names
+            ]
+        ],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--recordings", default=RECORDINGS_DIR)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds/request")
+    parser.add_argument("--page-size", type=int, default=1000, help="max rows/page")
+    parser.add_argument(
+        "--synthetic", action="store_true", help="serve made-up series when unrecorded"
+    )
+    parser.add_argument(
+        "--bench", action="store_true", help="run fetch benchmarks, then exit"
+    )
+    args = parser.parse_args()
+
+    server = StubServer(
+        port=0 if args.bench else args.port,
+        recordings_dir=args.recordings,
+        latency=args.latency,
+        page_size=args.page_size,
+        synthetic=args.synthetic,
+    )
+    if args.bench:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        _benchmark(server)
+    else:
+        print(f"Serving World Bank stand-in at {server.api_url} (WB_API_URL)")
+        server.serve_forever()
@@ -0,0 +1,162 @@
+import hashlib
+import io
+import json
+import os
+import re
+import time
+from urllib.parse import unquote
+
+import pandas as pd
+import requests
+
+# Fetched pages and the tables parsed out of them, keyed by page revision.
+CACHE_DIR = os.environ.get(
+    "WIKI_CACHE_DIR",
+    os.path.join(os.path.dirname(__file__), "..", "..", "data", "wiki_cache"),
+)
+# When set, pages are read from "<FIXTURE_DIR>/<Page_title>.html" instead of
+# the live site, and the network is never touched.
+FIXTURE_DIR = os.environ.get("WIKI_FIXTURE_DIR")
+
+API_URL = "https://en.wikipedia.org/w/api.php"
+INDEX_URL = "https://en.wikipedia.org/w/index.php"
+# How long a page's known revision is trusted before asking Wikipedia again.
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+_TABLE_TAG = re.compile(r"<(/?)table\b[^>]*>", re.IGNORECASE)
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+
+
+def page_title(url):
+    """Returns the page title of a https://en.wikipedia.org/wiki/<title> URL."""
+    return unquote(url.rsplit("/wiki/", 1)[-1]).split("#")[0]
+
+
+def _page_dir(title):
+    slug = re.sub(r"[^A-Za-z0-9_.-]", "_", title)
+    return os.path.join(CACHE_DIR, slug)
+
+
+def _load_index(title):
+    path = os.path.join(_page_dir(title), "index.json")
+    if os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+    return {}
+
+
+def _save_index(title, index):
+    os.makedirs(_page_dir(title), exist_ok=True)
+    with open(os.path.join(_page_dir(title), "index.json"), "w") as f:
+        json.dump(index, f)
+
+
+def _latest_revision(title, headers):
+    params = {
+        "action": "query",
+        "prop": "revisions",
+        "rvprop": "ids",
+        "titles": title,
+        "format": "json",
+    }
+    response = requests.get(API_URL, params=params, headers=headers, timeout=30)
+    response.raise_for_status()
+    page = next(iter(response.json()["query"]["pages"].values()))
+    return str(page["revisions"][0]["revid"])
+
+
+def _table_fragments(html):
+    """
+    Yields the source of every <table> element in document order, nested
+    tables included, which is the order pd.read_html numbers them in.
+    Tables inside HTML comments are skipped, as pd.read_html skips them.
+    """
+    html = _COMMENT.sub("", html)
+    spans = []
+    still_open = []
+    for tag in _TABLE_TAG.finditer(html):
+        if not tag.group(1):
+            still_open.append(len(spans))
+            spans.append([tag.start(), None])
+        elif still_open:
+            spans[still_open.pop()][1] = tag.end()
+    for start, end in spans:
+        if end is not None:
+            yield html[start:end]
+
+
+def parse_tables(html, indices):
+    """
+    Parses only the tables at the given pd.read_html positions, stopping once
+    the highest requested one is found. Returns them in the order asked for.
+    """
+    wanted = set(indices)
+    found = {}
+    position = 0
+    for fragment in _table_fragments(html):
+        try:
+            table = pd.read_html(io.StringIO(fragment))[0]
+        except (ValueError, ImportError):
+            # Tables pd.read_html cannot turn into a frame are not numbered.
+            # (When lxml finds nothing, pandas falls back to the optional
+            # bs4/html5lib parsers and may fail to import them instead.)
+            continue
+        if position in wanted:
+            found[position] = table
+            if len(found) == len(wanted):
+                break
+        position += 1
+    missing = wanted - set(found)
+    if missing:
+        raise IndexError(f"page has no table at position(s) {sorted(missing)}")
+    return [found[i] for i in indices]
+
+
+def read_tables(url, indices, headers=None, max_age=DEFAULT_MAX_AGE):
+    """
+    Returns the tables at the given pd.read_html positions of a Wikipedia
+    page. The page HTML and the parsed tables are cached per revision, and
+    the latest revision id is only re-checked once max_age seconds have passed,
+    so repeat runs skip both the network and the HTML parse.
+    """
+    title = page_title(url)
+    page_dir = _page_dir(title)
+
+    if FIXTURE_DIR:
+        with open(os.path.join(FIXTURE_DIR, f"{title}.html"), encoding="utf-8") as f:
+            html = f.read()
+        revision = "fixture-" + hashlib.sha1(html.encode("utf-8")).hexdigest()[:12]
+    else:
+        html = None
+        index = _load_index(title)
+        if index and time.time() - index["checked"] < max_age:
+            revision = index["revision"]
+        else:
+            revision = _latest_revision(title, headers)
+            _save_index(title, {"revision": revision, "checked": time.time()})
+
+    key = "-".join(str(i) for i in indices)
+    tables_path = os.path.join(page_dir, f"{revision}_tables_{key}.pkl")
+    if os.path.exists(tables_path):
+        return pd.read_pickle(tables_path)
+
+    html_path = os.path.join(page_dir, f"{revision}.html")
+    if html is None:
+        if os.path.exists(html_path):
+            with open(html_path, encoding="utf-8") as f:
+                html = f.read()
+        else:
+            params = {"title": title, "oldid": revision}
+            response = requests.get(
+                INDEX_URL, params=params, headers=headers, timeout=60
+            )
+            response.raise_for_status()
+            html = response.text
+            os.makedirs(page_dir, exist_ok=True)
+            with open(html_path, "w", encoding="utf-8") as f:
+                f.write(html)
+
+    tables = parse_tables(html, indices)
+    os.makedirs(page_dir, exist_ok=True)
+    pd.to_pickle(tables, tables_path)
+    return tables
@@ -1,6 +1,11 @@
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import crossings, scenarios  # noqa: E402
+
 # ---------------------------------------------------------
 # 1. Baseline Parameters (IMF 2026 Estimates)
 # ---------------------------------------------------------
@@ -16,45 +21,61 @@ data = {
 # ---------------------------------------------------------
 # 2. Dynamic Trajectory Generation
 # ---------------------------------------------------------
-current_year = start_year
-years_log = [start_year]
-trajectories = {region: [val[0]] for region, val in data.items()}
-current_rates = {region: val[1] for region, val in data.items()}
-current_values = {region: val[0] for region, val in data.items()}
-
-while True:
-    current_year += 1
-    years_log.append(current_year)
-
-    for region in data:
-        current_values[region] *= 1 + current_rates[region]
-        trajectories[region].append(current_values[region])
-
-    # Decrease growth rates by 0.5% every decade (every 10 years)
-    if (current_year - start_year) % 10 == 0:
-        for region in current_rates:
-            if current_rates[region] >= 4:
-                current_rates[region] -= 1.5
-            elif current_rates[region] >= 2:
-                current_rates[region] -= 1
-            elif current_rates[region] >= 1:
-                current_rates[region] -= 0.5
-            elif current_rates[region] >= 0.5:
-                current_rates[region] -= 0.25
-
-    # Stop execution when India intercepts the US
-    if current_values["India"] >= current_values["United States"]:
-        convergence_year = current_year
-        break
-
-    # Safety break to prevent infinite loops
-    if current_year > 2200:
-        convergence_year = current_year
-        break
-
-# Convert log tracking to arrays for structural indexing
-years_arr = np.array(years_log)
-traj_arr = {k: np.array(v) for k, v in trajectories.items()}
+# Growth rates are lowered every decade (every 10 years) by the decrement of
+# the first (threshold, decrement) tier they are at or above. Tiers are in the
+# same fractional units as the rates (0.04 = 4%)
+decay_tiers = [(0.04, 0.015), (0.02, 0.01), (0.01, 0.005), (0.005, 0.0025)]
+decay = scenarios.tiered_decay(decay_tiers)
+# Safety horizon for the projection
+horizon_year = 2201
+
+regions, start_values, growth_rates = scenarios.draw(data, 1)
+# Tiers in the wrong units match no rate, and the projection silently never
+# decays
+if not (decay(growth_rates) < growth_rates).any():
+    raise ValueError(f"No growth rate reaches a decay tier in {decay_tiers}")
+paths = scenarios.simulate(
+    start_values, growth_rates, horizon_year - start_year, decay=decay
+)[0]
+
+# Stop the projection when India intercepts the US
+india_ahead = (
+    paths[1:, regions.index("India")] >= paths[1:, regions.index("United States")]
+)
+n_years = india_ahead.argmax() + 1 if india_ahead.any() else len(paths) - 1
+convergence_year = start_year + n_years
+
+# Convert to arrays for structural indexing
+years_arr = np.arange(start_year, convergence_year + 1)
+traj_arr = {region: paths[: n_years + 1, k] for k, region in enumerate(regions)}
+
+# ---------------------------------------------------------
+# 2b. Monte Carlo Sensitivity of the Convergence Years
+# ---------------------------------------------------------
+# Start values are uncertain by ~5% and growth rates by half a percentage
+# point, and each scenario scales the decade decay steps by up to +/-50%. The
+# 10,000 scenarios take a while, so they only run when the script
+# is called with --sensitivity
+if "--sensitivity" in sys.argv[1:]:
+    n_scenarios = 10_000
+    scenario_spec = {
+        region: (scenarios.lognormal(value, 0.05), scenarios.normal(rate, 0.005))
+        for region, (value, rate) in data.items()
+    }
+    _, scenario_starts, scenario_rates = scenarios.draw(
+        scenario_spec, n_scenarios, seed=0
+    )
+    scenario_years = scenarios.convergence_years(
+        regions,
+        scenario_starts,
+        scenario_rates,
+        start_year,
+        horizon_year,
+        decay=decay,
+        decay_scale=np.random.default_rng(1).uniform(0.5, 1.5, n_scenarios),
+    )
+    print(f"Convergence years across {n_scenarios:,} scenarios:")
+    print(scenarios.summarize(scenario_years).round(2).to_string())
 
 # ---------------------------------------------------------
 # 3. Intersection Mapping Matrix (Dynamic with Interpolation)
@@ -62,35 +83,24 @@ traj_arr = {k: np.array(v) for k, v in trajectories.items()}
 intersections = []
 
 
+# Every pairwise crossing of the trajectories, linearly interpolated
+crossing_events = crossings.find_crossings(
+    np.column_stack(list(traj_arr.values())), years_arr, list(traj_arr)
+)
+
+
 def find_first_crossing(r1, r2, label, align):
-    # Find indices where r1 crosses r2
-    # We assume r1 starts lower than r2 and overtakes it
-    for i in range(1, len(years_arr)):
-        if (
-            traj_arr[r1][i] >= traj_arr[r2][i]
-            and traj_arr[r1][i - 1] < traj_arr[r2][i - 1]
-        ):
-            # Linear interpolation for precise visual crossover
-            y1_prev, y1_curr = traj_arr[r1][i - 1], traj_arr[r1][i]
-            y2_prev, y2_curr = traj_arr[r2][i - 1], traj_arr[r2][i]
-
-            denom = (y1_curr - y1_prev) - (y2_curr - y2_prev)
-            if denom == 0:
-                fractional_year = 0
-            else:
-                fractional_year = (y2_prev - y1_prev) / denom
-
-            exact_year = years_arr[i - 1] + fractional_year
-            exact_y_val = y1_prev + fractional_year * (y1_curr - y1_prev)
-
-            return {
-                "year": exact_year,
-                "y_val": exact_y_val,
-                "label": label,
-                "align": align,
-                "display_year": int(np.round(exact_year)),
-            }
-    return None
+    # First time r1 overtakes r2
+    crossing = crossings.first_crossing(crossing_events, r1, r2)
+    if crossing is None:
+        return None
+    return {
+        "year": crossing["time"],
+        "y_val": crossing["value"],
+        "label": label,
+        "align": align,
+        "display_year": int(np.round(crossing["time"])),
+    }
 
 
 # Mapping relevant intersection points
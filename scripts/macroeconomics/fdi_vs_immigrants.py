@@ -1,8 +1,11 @@
+import os
+import sys
 import traceback
 import pandas as pd
 import matplotlib.pyplot as plt
-import re
-import requests  # <-- Import requests library
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import country_codes, wiki_tables  # noqa: E402
 
 # List of major economies by nominal GDP (2025 estimate)
 major_economies = [
@@ -45,18 +48,9 @@ print("Major Economies:", major_economies)
 # --- Helper Functions (unchanged) ---
 
 
-def clean_country_name(name):
-    """Cleans country names for merging."""
-    name = str(name).strip()
-    name = re.sub(r"\[.*?\]", "", name)
-    name = name.split("[")[0]
-    if name == "United States":
-        name = "United States"
-    if name == "Russian Federation":
-        name = "Russia"
-    if name in ["Curaçao", "Curaçao[b]"]:
-        name = "Curaçao"
-    return name
+def clean_country_names(names):
+    """Canonicalizes a column of country names for merging (vectorized)."""
+    return country_codes.name_of(country_codes.to_iso3(names)).fillna(names)
 
 
 def clean_numeric_col(series):
@@ -87,7 +81,7 @@ def find_fdi_table(tables_list):
                     ["Country/Territory_Country/Territory", "% of GDP_2023"]
                 ]
                 df_fdi.columns = ["Country", "FDI_pct_GDP"]
-                df_fdi["Country"] = df_fdi["Country"].apply(clean_country_name)
+                df_fdi["Country"] = clean_country_names(df_fdi["Country"])
                 df_fdi["FDI_pct_GDP"] = clean_numeric_col(df_fdi["FDI_pct_GDP"])
                 return df_fdi
     return None
@@ -109,7 +103,7 @@ def find_immigrant_table(tables_list):
             df_imm = table.copy()
             df_imm = df_imm[["Name", "% of population"]]
             df_imm.columns = ["Country", "Immigrant_pct_Pop"]
-            df_imm["Country"] = df_imm["Country"].apply(clean_country_name)
+            df_imm["Country"] = clean_country_names(df_imm["Country"])
             df_imm["Immigrant_pct_Pop"] = clean_numeric_col(df_imm["Immigrant_pct_Pop"])
             return df_imm
     return None
@@ -126,7 +120,7 @@ def find_emigrant_table(tables_list):
                 df_em.columns = ["_".join(col).strip() for col in df_em.columns.values]
                 df_em = df_em[["Name_Name", "Emigrants_% of population"]]
                 df_em.columns = ["Country", "Emigrant_pct_Pop"]
-                df_em["Country"] = df_em["Country"].apply(clean_country_name)
+                df_em["Country"] = clean_country_names(df_em["Country"])
                 df_em["Emigrant_pct_Pop"] = clean_numeric_col(df_em["Emigrant_pct_Pop"])
                 return df_em
     return None
@@ -143,20 +137,15 @@ try:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36"
     }
 
-    # 2. Load Data using 'requests'
+    # 2. Load Data (page HTML and parsed tables are cached per page revision;
+    # set WIKI_FIXTURE_DIR to read saved pages instead of the live site)
     print("Fetching FDI data...")
-    html_fdi = requests.get(url_fdi, headers=headers).text
-    all_tables_fdi = pd.read_html(html_fdi)
-    print(f"Loaded {len(all_tables_fdi)} tables from FDI URL.")
+    (df_fdi,) = wiki_tables.read_tables(url_fdi, [0], headers=headers)
 
     print("Fetching Population data...")
-    html_pop = requests.get(url_pop, headers=headers).text
-    all_tables_pop = pd.read_html(html_pop)
-    print(f"Loaded {len(all_tables_pop)} tables from Population URL.")
+    (df_imm,) = wiki_tables.read_tables(url_pop, [1], headers=headers)
 
     # 3. Find and Process Each Table
-    df_fdi = all_tables_fdi[0]  # find_fdi_table([all_tables_fdi[0]])
-    df_imm = all_tables_pop[1]  # find_immigrant_table(all_tables_pop)
     # df_em = find_emigrant_table(all_tables_pop)
 
     if df_fdi is None:
@@ -183,13 +172,17 @@ try:
         "Inward_FDI_mil",
         "Inward_FDI_yr",
     ]
-    merged_imm = pd.merge(df_fdi, df_imm, on="Country", how="inner")
+    # Join on ISO3 codes so spelling differences between the two pages
+    # ("Russian Federation", "Türkiye", ...) do not drop countries.
+    merged_imm = country_codes.merge(df_fdi, df_imm, how="inner")
     merged_imm.dropna(subset=["FDI_pct_GDP", "Immigrant_pct_Pop"], inplace=True)
 
     print(f"\nMerged {len(merged_imm)} countries for Immigrant plot.")
 
     merged_imm = merged_imm[
-        merged_imm["Country"].isin(major_economies + tax_heaven_economies)
+        merged_imm["ISO3"].isin(
+            country_codes.to_iso3(major_economies + tax_heaven_economies)
+        )
     ]
     print("Immigrant Data Head:\n", merged_imm.head(30))
 
@@ -221,7 +214,7 @@ try:
 
     # 5. --- Plot 2: FDI vs. Emigrant Population ---
 
-    # merged_em = pd.merge(df_fdi, df_em, on='Country', how='inner')
+    # merged_em = country_codes.merge(df_fdi, df_em, how='inner')
     # merged_em.dropna(subset=['FDI_pct_GDP', 'Emigrant_pct_Pop'], inplace=True)
 
     # print(f"\nMerged {len(merged_em)} countries for Emigrant plot.")
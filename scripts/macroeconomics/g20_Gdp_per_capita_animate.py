@@ -1,10 +1,14 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-from sklearn.linear_model import LinearRegression
+import os
+import sys
 import warnings
 
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import projection, render  # noqa: E402
+from common.bar_race import BarRace  # noqa: E402
+
 # Suppress potential future warnings from pandas
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
@@ -41,26 +45,10 @@ def get_hardcoded_g20_data():
 def extrapolate_gdp_data(df_historic):
     """Extrapolates GDP data to 2070 using a log-linear regression model."""
     last_historical_year = df_historic.index.max()
-    future_years = np.array(range(last_historical_year + 1, 2071))
-    all_country_series = []
-
-    for country in df_historic.columns:
-        series = df_historic[country].dropna()
-        X_train = series.index.values.reshape(-1, 1)
-        y_train_log = np.log(series.values)
-        model = LinearRegression()
-        model.fit(X_train, y_train_log)
-
-        future_years_reshaped = future_years.reshape(-1, 1)
-        log_predictions = model.predict(future_years_reshaped)
-        predictions = np.exp(log_predictions)
-
-        future_series = pd.Series(predictions, index=future_years)
-        full_series = pd.concat([series, future_series])
-        full_series.name = country
-        all_country_series.append(full_series)
-
-    df_extrapolated = pd.concat(all_country_series, axis=1)
+    future_years = np.arange(last_historical_year + 1, 2071)
+    df_future = projection.extrapolate_log_linear(df_historic, future_years)
+
+    df_extrapolated = pd.concat([df_historic, df_future])
     df_extrapolated.index.name = "Year"
     return df_extrapolated
 
@@ -78,60 +66,51 @@ def create_gdp_animation(df_animated):
         "United States": "orange",
     }
 
-    def animate(year):
-        ax.clear()
-        data_for_year = df_animated.loc[year].dropna().sort_values()
-
-        # Create colors array for all countries
-        colors = []
-        for country in data_for_year.index:
-            if country in country_colors:
-                colors.append(country_colors[country])
-            else:
-                colors.append("steelblue")
-
-        # Create bar plot
-        bars = ax.bar(data_for_year.index, data_for_year.values, color=colors)
-
-        # Add value labels on top of each bar
-        for bar in bars:
-            yval = bar.get_height()
-            ax.text(
-                bar.get_x() + bar.get_width() / 2,
-                yval + 500,  # Add 500 to position text above bar
-                f"{yval / 1000:,.1f}K",  # Format as float with one decimal place
-                ha="center",
-                va="bottom",
-                fontsize=10,
-                rotation=0,
-            )
-
-        ax.set_title(f"G20 Nominal GDP Per Capita in {year}", fontsize=20, pad=20)
-        ax.set_ylabel("Nominal GDP Per Capita (Current US$)", fontsize=14)
-        ax.set_ylim(0, df_animated.values.max() * 1.05)
-        ax.tick_params(axis="x", labelrotation=60, labelsize=11)
-        ax.grid(axis="y", linestyle="--", alpha=0.7)
-        ax.text(
-            0.97,
-            0.95,
-            str(year),
-            transform=ax.transAxes,
-            fontsize=24,
-            fontweight="bold",
-            ha="right",
-            va="top",
-            color="gray",
-        )
+    # Static chart elements, drawn once
+    ax.set_ylabel("Nominal GDP Per Capita (Current US$)", fontsize=14)
+    ax.tick_params(axis="x", labelrotation=60, labelsize=11)
+    ax.grid(axis="y", linestyle="--", alpha=0.7)
+
+    countries = list(df_animated.columns)
+    race = BarRace(
+        ax,
+        countries,
+        {c: country_colors.get(c, "steelblue") for c in countries},
+        horizontal=False,
+        # Format as float with one decimal place
+        value_format=lambda value: f"{value / 1000:,.1f}K",
+        # Add 500 to position text above bar
+        value_position=lambda value: value + 500,
+        value_kwargs=dict(ha="center", va="bottom", fontsize=10, rotation=0),
+        limit=df_animated.values.max() * 1.05,
+    )
+    title = ax.set_title("", fontsize=20, pad=20)
+    year_text = ax.text(
+        0.97,
+        0.95,
+        "",
+        transform=ax.transAxes,
+        fontsize=24,
+        fontweight="bold",
+        ha="right",
+        va="top",
+        color="gray",
+    )
 
-        fig.tight_layout(pad=2.0)
+    def animate(year):
+        artists = race.update(df_animated.loc[year].to_numpy())
+        title.set_text(f"G20 Nominal GDP Per Capita in {year}")
+        year_text.set_text(str(year))
+        return [*artists, title, year_text]
 
-    ani = FuncAnimation(
-        fig, animate, frames=animation_years, interval=200, repeat=False
-    )
+    # Lay the chart out once for the widest labels of any frame, instead of
+    # re-running tight_layout in every frame
+    render.freeze_layout(fig, animate, animation_years, pad=2.0)
 
     try:
         output_filename = "g20_gdp_per_capita_animation.mp4"
-        ani.save(output_filename, writer="ffmpeg", fps=1, dpi=150)
+        # Frames are rendered in parallel and merged in order
+        render.save(fig, animate, animation_years, output_filename, fps=1, dpi=150)
         print(f"✅ Animation successfully saved as '{output_filename}'")
     except FileNotFoundError:
         print("❌ Error: 'ffmpeg' not found.")
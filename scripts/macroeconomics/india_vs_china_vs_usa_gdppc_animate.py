@@ -1,19 +1,25 @@
 import math
+import os
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
-from pandas_datareader import wb
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import render, wb_cache  # noqa: E402
+from common.panel import Panel  # noqa: E402
+from common.ratios import RatioCube  # noqa: E402
 
 # Get GDP per capita data
 countries = ["IND", "CHN", "USA"]
 indicator = "NY.GDP.PCAP.CD"
 
-df = wb.download(indicator=indicator, country=countries, start=1973, end=2023)
-df = df.reset_index().pivot(index="year", columns="country", values=indicator)
-df.index = df.index.astype(int)
-df["multiple_usa_india"] = df["United States"] / df["India"]
-df["multiple_chn_india"] = df["China"] / df["India"]
-df["multiple_usa_chn"] = df["United States"] / df["China"]
+df = wb_cache.download(indicator=indicator, country=countries, start=1973, end=2023)
+df = Panel.from_long(df.reset_index(), values=indicator).frame(indicator)
+ratios = RatioCube.from_frame(df)
+multiple_usa_india = ratios.series("United States", "India")
+multiple_chn_india = ratios.series("China", "India")
+multiple_usa_chn = ratios.series("United States", "China")
 persistent_years = [1993, 2001, 2013, 2023]
 
 # Create figure and axes
@@ -29,7 +35,7 @@ ax1.grid(True, which="both", ls="--")
 ax1.set_title("GDP per capita: India vs USA vs China (1973-2023)")
 ax1.set_ylabel("GDP per capita (USD)")
 
-ax2.set_ylim(0, max(df["multiple_usa_india"].max(), df["multiple_usa_chn"].max()) * 1.1)
+ax2.set_ylim(0, max(multiple_usa_india.max(), multiple_usa_chn.max()) * 1.1)
 ax2.set_xlim(df.index.min(), df.index.max())
 ax2.grid(True)
 ax2.set_ylabel("Multiple")
@@ -51,6 +57,7 @@ year_text = ax1.text(
     color="darkred",
 )
 multiple_texts = []
+labelled_years = set()  # Years whose persistent text is already drawn
 cached_annotations = None  # Store 2023 annotation data
 
 
@@ -81,8 +88,8 @@ def animate(i):
     line1.set_data(years, df["India"].iloc[: current_idx + 1])
     line2.set_data(years, df["United States"].iloc[: current_idx + 1])
     line3.set_data(years, df["China"].iloc[: current_idx + 1])
-    ratio_line_usa.set_data(years, df["multiple_usa_india"].iloc[: current_idx + 1])
-    ratio_line_usa_chn.set_data(years, df["multiple_usa_chn"].iloc[: current_idx + 1])
+    ratio_line_usa.set_data(years, multiple_usa_india.iloc[: current_idx + 1])
+    ratio_line_usa_chn.set_data(years, multiple_usa_chn.iloc[: current_idx + 1])
 
     # Use cached annotations for pause frames
     if i >= len(df) and cached_annotations is not None:
@@ -99,9 +106,9 @@ def animate(i):
         y_india = df["India"].iloc[current_idx]
         y_usa = df["United States"].iloc[current_idx]
         y_chn = df["China"].iloc[current_idx]
-        current_multiple_usa_india = df["multiple_usa_india"].iloc[current_idx]
-        current_multiple_chn_india = df["multiple_chn_india"].iloc[current_idx]
-        current_multiple_usa_chn = df["multiple_usa_chn"].iloc[current_idx]
+        current_multiple_usa_india = multiple_usa_india.iloc[current_idx]
+        current_multiple_chn_india = multiple_chn_india.iloc[current_idx]
+        current_multiple_usa_chn = multiple_usa_chn.iloc[current_idx]
 
         # Cache annotations when reaching 2023
         if current_year == 2023:
@@ -205,8 +212,9 @@ def animate(i):
         ]
     )
 
-    # Add persistent text on ax2 for specific years
-    if current_year in persistent_years:
+    # Add persistent text on ax2 for specific years, once per year
+    if current_year in persistent_years and current_year not in labelled_years:
+        labelled_years.add(current_year)
         ax2.text(
             current_year,
             current_multiple_usa_india,
@@ -252,10 +260,20 @@ ani = animation.FuncAnimation(
 ax1.legend()
 ax2.legend()
 
-# Save to MP4
-Writer = animation.writers["ffmpeg"]
-writer = Writer(fps=1, metadata=dict(artist="Me"), bitrate=1800)
-ani.save("india_vs_usa_china_gdp_comparison.mp4", writer=writer)
+# Save to MP4, rendering frames in parallel
+render.save(
+    fig,
+    animate,
+    range(len(df) + pause_frames),
+    "india_vs_usa_china_gdp_comparison.mp4",
+    fps=1,
+    init=init,
+    metadata=dict(artist="Me"),
+    bitrate=1800,
+    # Pause frames all reuse the cached annotations, so the first is rendered
+    # once and repeated
+    hold=lambda i: min(i, len(df)),
+)
 
 plt.tight_layout()
 plt.show()
@@ -1,8 +1,14 @@
 import math
+import os
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
-from pandas_datareader import wb
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import render, wb_cache  # noqa: E402
+from common.panel import Panel  # noqa: E402
+from common.ratios import RatioCube  # noqa: E402
 
 COLOR = "white"
 COLOR = "white"
@@ -14,15 +20,15 @@ plt.rcParams["ytick.color"] = COLOR
 countries = ["IND", "JP"]
 indicator = "NY.GDP.MKTP.CD"
 
-df = wb.download(indicator=indicator, country=countries, start=1992, end=2023)
-df = df.reset_index().pivot(index="year", columns="country", values=indicator)
+df = wb_cache.download(indicator=indicator, country=countries, start=1992, end=2023)
+df = Panel.from_long(df.reset_index(), values=indicator).frame(indicator)
 df.loc[2024] = {"India": 3.567552e12, "Japan": 4.104495e12}
 df.loc[2025] = {"India": 4.192345e12, "Japan": 4.191365e12}
 df.loc[2026] = {"India": 4.593552e12, "Japan": 4.373495e12}
 
 print(df.tail())
-df.index = df.index.astype(int)
-df["multiple_japan_india"] = df["Japan"] / df["India"]
+ratios = RatioCube.from_frame(df)
+multiple_japan_india = ratios.series("Japan", "India")
 persistent_years = [1993, 2000, 2008, 2014, 2019, 2025]
 
 # Create figure and axes
@@ -44,8 +50,8 @@ ax1.set_title(
 )
 ax1.set_ylabel("GDP (USD)")
 
-# ax2.set_ylim(0, max(df["multiple_japan_india"].max(), df["multiple_japan_chn"].max()) * 1.1)
-ax2.set_ylim(0, df["multiple_japan_india"].max() * 1.1)
+# ax2.set_ylim(0, max(multiple_japan_india.max(), df["multiple_japan_chn"].max()) * 1.1)
+ax2.set_ylim(0, multiple_japan_india.max() * 1.1)
 ax2.set_xlim(df.index.min(), df.index.max())
 ax2.grid(True)
 ax2.set_ylabel("Multiple")
@@ -67,6 +73,7 @@ year_text = ax1.text(
     color="orange",
 )
 multiple_texts = []
+labelled_years = set()  # Years whose persistent text is already drawn
 cached_annotations = None  # Store 2025 annotation data
 
 
@@ -94,7 +101,7 @@ def animate(i):
     # Set line data
     line1.set_data(years, df["India"].iloc[: current_idx + 1])
     line2.set_data(years, df["Japan"].iloc[: current_idx + 1])
-    ratio_line_japan.set_data(years, df["multiple_japan_india"].iloc[: current_idx + 1])
+    ratio_line_japan.set_data(years, multiple_japan_india.iloc[: current_idx + 1])
 
     # Use cached annotations for pause frames
     if i >= len(df) and cached_annotations is not None:
@@ -103,7 +110,7 @@ def animate(i):
         # Data for annotations
         y_india = df["India"].iloc[current_idx]
         y_japan = df["Japan"].iloc[current_idx]
-        current_multiple_japan_india = df["multiple_japan_india"].iloc[current_idx]
+        current_multiple_japan_india = multiple_japan_india.iloc[current_idx]
 
         # Cache annotations when reaching 2025
         if current_year == 2025:
@@ -151,8 +158,9 @@ def animate(i):
 
     multiple_texts.extend([japan_gdp, india_gdp, arrow_japan, multiple_text_japan])
 
-    # Add persistent text on ax2 for specific years
-    if current_year in persistent_years:
+    # Add persistent text on ax2 for specific years, once per year
+    if current_year in persistent_years and current_year not in labelled_years:
+        labelled_years.add(current_year)
         ax2.text(
             current_year,
             current_multiple_japan_india,
@@ -189,10 +197,20 @@ ani = animation.FuncAnimation(
 ax1.legend()
 ax2.legend()
 
-# Save to MP4
-Writer = animation.writers["ffmpeg"]
-writer = Writer(fps=1, metadata=dict(artist="Me"), bitrate=1800)
-ani.save("india_vs_japan_gdp_comparison.mp4", writer=writer)
+# Save to MP4, rendering frames in parallel
+render.save(
+    fig,
+    animate,
+    range(len(df) + pause_frames),
+    "india_vs_japan_gdp_comparison.mp4",
+    fps=1,
+    init=init,
+    metadata=dict(artist="Me"),
+    bitrate=1800,
+    # Pause frames all reuse the cached annotations, so the first is rendered
+    # once and repeated
+    hold=lambda i: min(i, len(df)),
+)
 
 plt.tight_layout()
 plt.show()
@@ -1,17 +1,23 @@
 import math
+import os
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
-from pandas_datareader import wb
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import render, wb_cache  # noqa: E402
+from common.panel import Panel  # noqa: E402
+from common.ratios import RatioCube  # noqa: E402
 
 # Get GDP per capita data
 countries = ["IND", "USA"]
 indicator = "NY.GDP.PCAP.CD"
 
-df = wb.download(indicator=indicator, country=countries, start=1973, end=2024)
-df = df.reset_index().pivot(index="year", columns="country", values=indicator)
-df.index = df.index.astype(int)
-df["multiple"] = df["United States"] / df["India"]
+df = wb_cache.download(indicator=indicator, country=countries, start=1973, end=2024)
+df = Panel.from_long(df.reset_index(), values=indicator).frame(indicator)
+ratios = RatioCube.from_frame(df)
+multiple = ratios.series("United States", "India")
 persistent_years = [1993, 2001, 2013, 2023]
 
 # Create figure and axes
@@ -22,12 +28,12 @@ fig, (ax1, ax2) = plt.subplots(
 # Plot formatting
 ax1.set_yscale("log")
 ax1.set_xlim(df.index.min(), df.index.max())
-ax1.set_ylim(df.min().min() * 0.9, df.max().max() * 1.1)
+ax1.set_ylim(min(df.min().min(), multiple.min()) * 0.9, df.max().max() * 1.1)
 ax1.grid(True, which="both", ls="--")
 ax1.set_title("GDP per capita: India vs USA (1973-2023)")
 ax1.set_ylabel("GDP per capita (USD)")
 
-ax2.set_ylim(0, df["multiple"].max() * 1.1)
+ax2.set_ylim(0, multiple.max() * 1.1)
 ax2.set_xlim(df.index.min(), df.index.max())
 ax2.grid(True)
 ax2.set_ylabel("Multiple (USA/India)")
@@ -47,6 +53,7 @@ year_text = ax1.text(
     color="darkred",
 )
 multiple_texts = []
+labelled_years = set()  # Years whose persistent text is already drawn
 
 
 def init():
@@ -66,19 +73,19 @@ def animate(i):
         current_year = years[i]
         line1.set_data(years, df["India"].iloc[: i + 1])
         line2.set_data(years, df["United States"].iloc[: i + 1])
-        ratio_line.set_data(years, df["multiple"].iloc[: i + 1])
+        ratio_line.set_data(years, multiple.iloc[: i + 1])
         y_india = df["India"].iloc[i]
         y_usa = df["United States"].iloc[i]
-        current_multiple = df["multiple"].iloc[i]
+        current_multiple = multiple.iloc[i]
     else:
         years = df.index[: len(df) - 1 + 1]
         current_year = years[len(df) - 1]
         line1.set_data(years, df["India"].iloc[: len(df) - 1 + 1])
         line2.set_data(years, df["United States"].iloc[: len(df) - 1 + 1])
-        ratio_line.set_data(years, df["multiple"].iloc[: len(df) - 1 + 1])
+        ratio_line.set_data(years, multiple.iloc[: len(df) - 1 + 1])
         y_india = df["India"].iloc[len(df) - 1]
         y_usa = df["United States"].iloc[len(df) - 1]
-        current_multiple = df["multiple"].iloc[len(df) - 1]
+        current_multiple = multiple.iloc[len(df) - 1]
 
     mid_y = math.exp((math.log(y_india) + math.log(y_usa)) / 2)
 
@@ -116,8 +123,9 @@ def animate(i):
 
     multiple_texts.extend([usa_gdp, india_gdp, arrow, multiple_text])
 
-    # Add persistent text on ax2 for specific years
-    if current_year in persistent_years:
+    # Add persistent text on ax2 for specific years, once per year
+    if current_year in persistent_years and current_year not in labelled_years:
+        labelled_years.add(current_year)
         ax2.text(
             current_year,
             current_multiple,
@@ -149,10 +157,19 @@ ani = animation.FuncAnimation(
 ax1.legend()
 ax2.legend()
 
-# Save to MP4
-Writer = animation.writers["ffmpeg"]
-writer = Writer(fps=1, metadata=dict(artist="Me"), bitrate=1800)
-ani.save("india_vs_usa_gdp_comparison.mp4", writer=writer)
+# Save to MP4, rendering frames in parallel
+render.save(
+    fig,
+    animate,
+    range(len(df) + pause_frames),
+    "india_vs_usa_gdp_comparison.mp4",
+    fps=1,
+    init=init,
+    metadata=dict(artist="Me"),
+    bitrate=1800,
+    # Pause frames all show the last year, so it is rendered once
+    hold=lambda i: min(i, len(df) - 1),
+)
 
 plt.tight_layout()
 plt.show()
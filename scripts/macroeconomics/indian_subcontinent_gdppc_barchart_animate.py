@@ -1,27 +1,14 @@
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import numpy as np
 import pandas as pd
 import calendar  # For month names
+import os
+import sys
 
-
-# Helper function to ensure a scalar value is extracted from DataFrame .loc result
-def get_scalar_value(value_from_loc, country_name, year_val):
-    """
-    Converts a value retrieved by .loc to a scalar.
-    If it's a Series with one item, returns that item.
-    If it's already a scalar, returns it.
-    If it's a Series with multiple items, prints a warning and returns np.nan.
-    """
-    if isinstance(value_from_loc, pd.Series):
-        if len(value_from_loc) == 1:
-            return value_from_loc.item()
-        else:
-            print(
-                f"  Warning: Multiple values found for {country_name}, year {year_val} during scalar extraction. Check data uniqueness."
-            )
-            return np.nan  # Indicates an issue
-    return value_from_loc  # Assumed to be scalar already
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import crossings, projection, render, tween  # noqa: E402
+from common.bar_race import BarRace  # noqa: E402
+from common.cagr import CagrMatrix  # noqa: E402
 
 
 # Helper function for annual data interpolation
@@ -111,45 +98,44 @@ df_historical_annual = pd.DataFrame(historical_gdp_data_annual)
 df_historical_annual.index.name = "Year"
 df_historical_annual.index = pd.to_datetime(df_historical_annual.index, format="%Y")
 
-# Convert annual data to monthly data by linear interpolation
-df_historical_monthly = df_historical_annual.resample("MS").interpolate(method="linear")
-df_historical_monthly.index = df_historical_monthly.index.to_period("M")
+# Convert annual data to monthly data by linear interpolation (12 frames a year)
+_, historical_monthly_values = tween.tween(
+    df_historical_annual, df_historical_annual.index.year, frames_per_step=12
+)
+df_historical_monthly = pd.DataFrame(
+    historical_monthly_values,
+    index=pd.period_range(
+        df_historical_annual.index[0], periods=len(historical_monthly_values), freq="M"
+    ),
+    columns=df_historical_annual.columns,
+)
 
 # 2. Extrapolation
 annual_growth_factors = {}
 cagr_calc_start_year = 2015
 cagr_calc_end_year = 2024
-num_years_for_cagr = cagr_calc_end_year - cagr_calc_start_year
+
+historical_cagr = CagrMatrix.from_frame(df_historical_annual)
 
 print("Calculating annual growth factors for extrapolation (based on 2015-2024 data):")
 for country in countries:
     try:
-        start_val_raw = df_historical_annual.loc[str(cagr_calc_start_year), country]
-        end_val_raw = df_historical_annual.loc[str(cagr_calc_end_year), country]
-        start_val = get_scalar_value(start_val_raw, country, cagr_calc_start_year)
-        end_val = get_scalar_value(end_val_raw, country, cagr_calc_end_year)
+        cagr = historical_cagr.rate(cagr_calc_start_year, cagr_calc_end_year, country)
     except KeyError:
         print(
             f"  Warning: Data for year {cagr_calc_start_year} or {cagr_calc_end_year} not found for {country}."
         )
-        start_val, end_val = np.nan, np.nan
-
-    if (
-        pd.isna(start_val)
-        or pd.isna(end_val)
-        or start_val <= 0
-        or end_val <= 0
-        or num_years_for_cagr <= 0
-    ):
+        cagr = np.nan
+
+    if pd.isna(cagr):
         default_growth = 1.02
         if country == "India":
             default_growth = 1.065
         annual_growth_factors[country] = default_growth
         print(
-            f"  Warning: Could not calculate CAGR for {country} (start: {start_val}, end: {end_val}). Using default: {annual_growth_factors[country]:.4f}"
+            f"  Warning: Could not calculate CAGR for {country}. Using default: {annual_growth_factors[country]:.4f}"
         )
     else:
-        cagr = (end_val / start_val) ** (1 / num_years_for_cagr) - 1
         annual_growth_factors[country] = 1 + cagr
     print(
         f"  {country}: {annual_growth_factors[country]:.4f} ({(annual_growth_factors[country] - 1) * 100:.2f}% annual growth)"
@@ -162,62 +148,34 @@ print("\nMonthly growth factors for projection:")
 for country, factor in monthly_growth_factors.items():
     print(f"  {country}: {factor:.6f} ({(factor - 1) * 100:.4f}% monthly growth)")
 
-df_extrapolated_monthly = df_historical_monthly.copy()
 last_historical_period = df_historical_monthly.index.max()
-current_projection_period = last_historical_period
-extrapolation_stop_period = last_historical_period
 
 max_allowable_projection_year = 2047
 max_allowable_projection_period = pd.Period(
     f"{max_allowable_projection_year}-12", freq="M"
 )
 
-india_overtook_sri_lanka = False
-india_overtook_bangladesh = False
-india_overtook_bhutan = False
-
-while current_projection_period < max_allowable_projection_period:
-    current_projection_period += 1
-    next_gdp_row = {}
-    for country in countries:
-        prev_period_gdp = df_extrapolated_monthly.loc[
-            current_projection_period - 1, country
-        ]
-        next_gdp_row[country] = prev_period_gdp * monthly_growth_factors[country]
-    df_extrapolated_monthly.loc[current_projection_period] = next_gdp_row
-
-    india_gdp_current = df_extrapolated_monthly.loc[current_projection_period, "India"]
-    sri_lanka_gdp_current = df_extrapolated_monthly.loc[
-        current_projection_period, "Sri Lanka"
-    ]
-    bangladesh_gdp_current = df_extrapolated_monthly.loc[
-        current_projection_period, "Bangladesh"
-    ]
-    bhutan_gdp_current = df_extrapolated_monthly.loc[
-        current_projection_period, "Bhutan"
-    ]
-
-    if not india_overtook_sri_lanka and india_gdp_current > sri_lanka_gdp_current:
-        print(
-            f"INFO: India (GDP: ${india_gdp_current:,.0f}) surpassed Sri Lanka (GDP: ${sri_lanka_gdp_current:,.0f}) in {current_projection_period}"
-        )
-        india_overtook_sri_lanka = True
-    if not india_overtook_bangladesh and india_gdp_current > bangladesh_gdp_current:
-        print(
-            f"INFO: India (GDP: ${india_gdp_current:,.0f}) surpassed Bangladesh (GDP: ${bangladesh_gdp_current:,.0f}) in {current_projection_period}"
-        )
-        india_overtook_bangladesh = True
-    if not india_overtook_bhutan and india_gdp_current > bhutan_gdp_current:
+# Project every country to the horizon in one step: last value * factor ** months
+df_extrapolated_monthly = projection.extend_monthly(
+    df_historical_monthly, annual_growth_factors, max_allowable_projection_period
+)
+extrapolation_stop_period = max_allowable_projection_period
+
+# Starting from the last historical month also catches an overtake that
+# happens on the very first projected month.
+df_projected_monthly = df_extrapolated_monthly.loc[last_historical_period:]
+projected_crossings = crossings.find_crossings(df_projected_monthly)
+for rival in ["Sri Lanka", "Bangladesh", "Bhutan"]:
+    overtake = crossings.first_crossing(projected_crossings, "India", rival)
+    if overtake is not None:
+        overtake_period = df_projected_monthly.index[overtake["step"]]
         print(
-            f"INFO: India (GDP: ${india_gdp_current:,.0f}) surpassed Bhutan (GDP: ${bhutan_gdp_current:,.0f}) in {current_projection_period}"
+            f"INFO: India (GDP: ${df_projected_monthly.loc[overtake_period, 'India']:,.0f}) surpassed {rival} (GDP: ${df_projected_monthly.loc[overtake_period, rival]:,.0f}) in {overtake_period}"
         )
-        india_overtook_bhutan = True
 
-else:
-    extrapolation_stop_period = max_allowable_projection_period
-    print(
-        f"WARNING: India did not surpass both Sri Lanka and Bhutan by {max_allowable_projection_period}. Animation runs until then."
-    )
+print(
+    f"WARNING: India did not surpass both Sri Lanka and Bhutan by {max_allowable_projection_period}. Animation runs until then."
+)
 
 start_animation_period = pd.Period("1990-01", freq="M")
 periods_for_animation = df_extrapolated_monthly.loc[
@@ -239,109 +197,104 @@ projection_end_year_for_annotation = extrapolation_stop_period.year
 projected_data_text = f"Projected Data ({projection_start_year_for_annotation}-{projection_end_year_for_annotation})"
 
 
+# Static chart elements, drawn once
+ax.set_title(
+    "GDP per Capita (PPP, Current Int'l $)", fontsize=18, fontweight="bold", pad=20
+)
+ax.tick_params(axis="x", labelsize=11)
+ax.grid(axis="x", linestyle="--", alpha=0.7)
+ax.set_facecolor("#f0f0f0")
+fig.patch.set_facecolor("#e0e0e0")
+
+race = BarRace(
+    ax,
+    countries,
+    country_color_map,
+    value_format=lambda value: f"${value:,.0f}",
+    # Value label (outside the bar, to the right)
+    value_position=lambda value: value * 1.01,
+    value_kwargs=dict(
+        va="center", ha="left", fontsize=18, fontweight="bold", color="black"
+    ),
+    tick_kwargs=dict(fontsize=16, fontweight="bold"),
+    # Increased padding for value labels
+    limit=lambda max_gdp_in_frame: max_gdp_in_frame * 1.28,
+)
+
+# Date display (Month-Year)
+date_text = ax.text(
+    0.98,
+    0.03,
+    "",
+    transform=ax.transAxes,
+    fontsize=20,
+    color="red",
+    ha="right",
+    va="bottom",
+    fontweight="bold",
+    bbox=dict(boxstyle="round,pad=0.3", fc="white", alpha=0.7),
+)
+
+# Projected data annotation, shown once the projection starts
+projected_text = ax.text(
+    0.98,
+    0.11,
+    projected_data_text,
+    transform=ax.transAxes,
+    fontsize=16,
+    color="darkblue",
+    ha="right",
+    va="bottom",
+    alpha=0.8,
+    bbox=dict(boxstyle="round,pad=0.3", fc="lightyellow", alpha=0.6),
+)
+
+animation_values = df_extrapolated_monthly.loc[
+    periods_for_animation, countries
+].to_numpy()
+
+
 def animate_gdp_chart(frame_number):
     # Cap the period index at the last valid period for pause frames
     period_index = min(frame_number, len(periods_for_animation) - 1)
     current_period = periods_for_animation[period_index]
-    ax.clear()
-    # Get data for the current period and sort by GDP value
-    gdp_data_for_period = df_extrapolated_monthly.loc[
-        current_period, countries
-    ].sort_values(ascending=False)
-
-    # Country names for y-axis labels (without flags here)
-    y_labels_plain = gdp_data_for_period.index.tolist()
-    bar_colors_sorted = [country_color_map[country] for country in y_labels_plain]
-
-    # Create horizontal bars
-    bars = ax.barh(
-        y_labels_plain, gdp_data_for_period.values, color=bar_colors_sorted, height=0.8
-    )
-    ax.set_yticks(np.arange(len(y_labels_plain)))
-    ax.set_yticklabels(y_labels_plain, fontsize=16, fontweight="bold")
-
-    ax.set_title(
-        "GDP per Capita (PPP, Current Int'l $)", fontsize=18, fontweight="bold", pad=20
-    )
-    ax.invert_yaxis()  # Highest GDP at the top
-
-    # Add value labels
-    for i, bar in enumerate(bars):
-        country_name = y_labels_plain[i]  # Get country name from sorted list
-        bar_width = bar.get_width()
-
-        # Value label (outside the bar, to the right)
-        value_label_x_position = bar_width * 1.01
-        ax.text(
-            value_label_x_position,
-            bar.get_y() + bar.get_height() / 2.0,
-            f"${bar_width:,.0f}",
-            va="center",
-            ha="left",
-            fontsize=18,
-            fontweight="bold",
-            color="black",
-        )
 
-    max_gdp_in_frame = gdp_data_for_period.max()
-    ax.set_xlim(0, max_gdp_in_frame * 1.28)  # Increased padding for value labels
-    ax.tick_params(axis="x", labelsize=11)
+    artists = race.update(animation_values[period_index])
 
-    # Date display (Month-Year)
     month_name = calendar.month_abbr[current_period.month]
-    date_display_text = f"{month_name}-{current_period.year}"
-    ax.text(
-        0.98,
-        0.03,
-        date_display_text,
-        transform=ax.transAxes,
-        fontsize=20,
-        color="red",
-        ha="right",
-        va="bottom",
-        fontweight="bold",
-        bbox=dict(boxstyle="round,pad=0.3", fc="white", alpha=0.7),
-    )
-
-    # Projected data annotation
-    if current_period > last_historical_period:
-        ax.text(
-            0.98,
-            0.11,
-            projected_data_text,
-            transform=ax.transAxes,
-            fontsize=16,
-            color="darkblue",
-            ha="right",
-            va="bottom",
-            alpha=0.8,
-            bbox=dict(boxstyle="round,pad=0.3", fc="lightyellow", alpha=0.6),
-        )
-
-    ax.grid(axis="x", linestyle="--", alpha=0.7)
-    ax.set_facecolor("#f0f0f0")
-    fig.patch.set_facecolor("#e0e0e0")
-    plt.tight_layout(pad=3.0)  # Increased padding slightly
+    date_text.set_text(f"{month_name}-{current_period.year}")
+    projected_text.set_visible(current_period > last_historical_period)
+    return [*artists, date_text, projected_text]
 
 
 pause_frames = 20
 animation_frames_count = len(periods_for_animation)
-ani = animation.FuncAnimation(
-    fig,
-    animate_gdp_chart,
-    frames=animation_frames_count + pause_frames,
-    interval=100,
-    repeat=False,
-)
+
+# Lay the chart out once (increased padding slightly) for the widest labels
+# of any frame, instead of re-running tight_layout in every frame
+render.freeze_layout(fig, animate_gdp_chart, range(animation_frames_count), pad=3.0)
 
 # Save the animation
 print("Attempting to save animation as 'gdp_per_capita_monthly_animation.mp4'...")
 try:
-    Writer = animation.writers["ffmpeg"]
-    writer = Writer(fps=10, metadata=dict(artist="GDP Visualizer"), bitrate=2000)
-    ani.save("gdp_per_capita_monthly_animation.mp4", writer=writer)
+    # Frames are rendered in parallel and merged in order
+    render.save(
+        fig,
+        animate_gdp_chart,
+        range(animation_frames_count + pause_frames),
+        "gdp_per_capita_monthly_animation.mp4",
+        fps=10,
+        metadata=dict(artist="GDP Visualizer"),
+        bitrate=2000,
+        # Pause frames all show the last period, so it is rendered once
+        hold=lambda frame_number: min(frame_number, animation_frames_count - 1),
+    )
     print("Animation successfully saved.")
+except FileNotFoundError:
+    print(
+        "Error saving animation: ffmpeg not found. Ensure it is installed and in PATH."
+    )
 except RuntimeError as e:
-    print(f"Error saving animation: {e}. Ensure ffmpeg is installed and in PATH.")
+    print(f"Error saving animation: {e}")
 except Exception as e:
     print(f"An unexpected error occurred during saving: {e}")
@@ -1,9 +1,14 @@
+import os
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
 from scipy.stats import linregress
 
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import wb_bulk  # noqa: E402
+
 ###############################################################################
 # SETTINGS
 ###############################################################################
@@ -22,14 +27,14 @@ LAND_FILE = "API_AG.LND.TOTL.K2_DS2_en_csv_v2.csv"
 
 def load_indicator(filename):
 
-    df = pd.read_csv(filename, skiprows=4)
-
-    keep = ["Country Name", "Country Code", START_YEAR, END_YEAR]
+    # The bulk CSV is converted once into a memory-mapped columnar store, so
+    # only the year columns used here are read on later runs.
+    keep = [START_YEAR, END_YEAR]
 
     if filename == LAND_FILE:
-        keep = ["Country Name", "Country Code", END_YEAR]
+        keep = [END_YEAR]
 
-    return df[keep]
+    return wb_bulk.load_columns(filename, keep)
 
 
 pop = load_indicator(POP_FILE)
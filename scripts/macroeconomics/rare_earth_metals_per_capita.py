@@ -1,25 +1,12 @@
+import os
+import sys
 import matplotlib.pyplot as plt
-import pandas as pd
-import io
-
-# Data from the image
-data = """Country,Tonnes per million people
-Greenland,26422406.20
-Vietnam,224103.72
-Australia,219230.77
-Brazil,96774.19
-Russia,68493.15
-China,31148.24
-Canada,21282.05
-Tanzania,14062.03
-South Africa,13166.67
-United States,5389.22
-India,4859.15
-Thailand,64.29
-"""
-
-# Read the data into a pandas DataFrame
-df = pd.read_csv(io.StringIO(data))
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import datasets  # noqa: E402
+
+# Data from the image (data/datasets/rare_earth_oxides_per_capita.csv)
+df = datasets.load("rare_earth_oxides_per_capita")
 
 # Sort the data to have the largest value on top
 df = df.sort_values(by="Tonnes per million people", ascending=True)
@@ -1,7 +1,11 @@
-import requests
+import os
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import wb_api  # noqa: E402
+
 # Country ISO codes and labels
 countries = {
     "IN": "India",
@@ -15,22 +19,9 @@ indicator = "NY.GDP.PCAP.CD"  # GDP per capita (current US$)
 end_year = 2023
 start_year = end_year - 9
 
-
-def fetch_gdp_per_capita(country_code):
-    url = f"https://api.worldbank.org/v2/country/{country_code}/indicator/{indicator}?format=json&date={start_year}:{end_year}&per_page=100"
-    response = requests.get(url)
-    data = response.json()[1]
-    return {
-        int(item["date"]): item["value"] for item in data if item["value"] is not None
-    }
-
-
-# Create DataFrame with GDP per capita data
-gdp_data = {}
-
-for code, name in countries.items():
-    gdp_per_year = fetch_gdp_per_capita(code)
-    gdp_data[name] = gdp_per_year
+# Create DataFrame with GDP per capita data (one batched request for all countries)
+gdp_by_code = wb_api.fetch_indicator(indicator, list(countries), start_year, end_year)
+gdp_data = {name: gdp_by_code[code] for code, name in countries.items()}
 
 df = pd.DataFrame(gdp_data)
 df = df.sort_index()
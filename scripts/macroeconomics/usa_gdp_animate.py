@@ -1,7 +1,12 @@
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import render  # noqa: E402
+
 # Parameters
 gdp_per_capita_2024 = 80300  # USD
 growth_rate = 0.02
@@ -47,9 +52,18 @@ ani = animation.FuncAnimation(
     interval=200,
     blit=True,
 )
-# Save to MP4
-Writer = animation.writers["ffmpeg"]
-writer = Writer(fps=1, metadata=dict(artist="Me"), bitrate=1800)
-ani.save("usa_gdp.mp4", writer=writer)
+# Save to MP4, rendering frames in parallel
+render.save(
+    fig,
+    animate,
+    range(len(years) + pause_frames),
+    "usa_gdp.mp4",
+    fps=1,
+    init=init,
+    metadata=dict(artist="Me"),
+    bitrate=1800,
+    # Pause frames all show the last year, so it is rendered once
+    hold=lambda i: min(i, len(years) - 1),
+)
 
 plt.show()
@@ -1,170 +1,13 @@
+import os
+import sys
 import matplotlib.pyplot as plt
-import pandas as pd
 
-# Expanded dataset with 50+ countries representing all regions and wealth levels
-data = {
-    "Country": [
-        "Monaco",
-        "Singapore",
-        "Hong Kong",
-        "USA",
-        "Norway",
-        "Australia",
-        "Canada",
-        "India",
-        "Bangladesh",
-        "Nigeria",
-        "Japan",
-        "Germany",
-        "Luxembourg",
-        "Ireland",
-        "Switzerland",
-        "Qatar",
-        "Iceland",
-        "Denmark",
-        "Netherlands",
-        "Sweden",
-        "Finland",
-        "Austria",
-        "Belgium",
-        "Israel",
-        "France",
-        "UK",
-        "New Zealand",
-        "Italy",
-        "Korea (South)",
-        "Spain",
-        "China",
-        "Brazil",
-        "Mexico",
-        "Indonesia",
-        "Turkey",
-        "Saudi Arabia",
-        "South Africa",
-        "Egypt",
-        "Vietnam",
-        "Pakistan",
-        "Ethiopia",
-        "Philippines",
-        "Thailand",
-        "Russia",
-        "Argentina",
-        "Chile",
-        "Colombia",
-        "Malaysia",
-        "Kazakhstan",
-        "Mongolia",
-        "Iceland",
-    ],
-    "Density": [
-        26000,
-        8000,
-        7100,
-        36,
-        15,
-        3.3,
-        4,
-        480,
-        1300,
-        230,
-        340,
-        240,
-        260,
-        72,
-        215,
-        248,
-        3.6,
-        137,
-        508,
-        25,
-        18,
-        109,
-        383,
-        420,
-        119,
-        277,
-        19,
-        205,
-        530,
-        94,
-        153,
-        25,
-        66,
-        151,
-        110,
-        16,
-        49,
-        105,
-        315,
-        310,
-        115,
-        368,
-        135,
-        9,
-        16,
-        26,
-        46,
-        99,
-        7,
-        2,
-        3.6,
-    ],
-    "GDP_Per_Capita": [
-        234000,
-        82000,
-        49000,
-        76000,
-        106000,
-        65000,
-        52000,
-        2400,
-        2700,
-        2200,
-        34000,
-        48000,
-        126000,
-        104000,
-        92000,
-        88000,
-        75000,
-        67000,
-        56000,
-        56000,
-        50000,
-        52000,
-        51000,
-        54000,
-        41000,
-        45000,
-        48000,
-        34000,
-        32000,
-        30000,
-        12700,
-        8900,
-        11000,
-        4700,
-        10600,
-        30000,
-        6700,
-        4300,
-        4100,
-        1600,
-        1000,
-        3600,
-        7000,
-        12000,
-        13000,
-        15000,
-        6600,
-        12000,
-        11000,
-        1900,
-        75000,
-    ],
-}
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import datasets  # noqa: E402
 
-df = pd.DataFrame(data)
+# Expanded dataset with 50+ countries representing all regions and wealth levels
+# (data/datasets/population_density_gdp_per_capita.csv)
+df = datasets.load("population_density_gdp_per_capita")
 
 # Create the plot
 plt.figure(figsize=(15, 9))
@@ -1,8 +1,11 @@
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import numpy as np
-from scipy.optimize import curve_fit
 import matplotlib  # <--- Explicitly importing base matplotlib
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import fitting, render  # noqa: E402
 
 # --- Data (2015-2024 Historical) ---
 years_historical = np.array(
@@ -18,55 +21,26 @@ total_electricity_hist_values = np.array(
 )
 
 
-# --- Curve Fitting Function ---
-def exponential_func(x, a, b):
-    return a * np.exp(b * x)
-
-
+# --- Curve Fitting: a * exp(b * x), both series at once ---
 x_fit_common = years_historical - years_historical[0]
-popt_ai, pcov_ai = curve_fit(
-    exponential_func,
+(a_ai, a_total), (b_ai, b_total) = fitting.fit_exponentials(
     x_fit_common,
-    ai_energy_hist_values,
-    p0=[ai_energy_hist_values[0], 0.4],
-    maxfev=5000,
+    np.column_stack([ai_energy_hist_values, total_electricity_hist_values]),
 )
-a_ai, b_ai = popt_ai
 print(
     f"AI Energy Fitted Parameters (10yr hist): a={a_ai:.2f}, b={b_ai:.4f}, CAGR: {(np.exp(b_ai) - 1) * 100:.2f}%"
 )
-
-# Corrected line from previous error: Changed maxfeev to maxfev
-popt_total, pcov_total = curve_fit(
-    exponential_func,
-    x_fit_common,
-    total_electricity_hist_values,
-    p0=[total_electricity_hist_values[0], 0.03],
-    maxfev=5000,
-)
-a_total, b_total = popt_total
 print(
     f"Total Electricity Fitted Parameters (10yr hist): a={a_total:.2f}, b={b_total:.4f}, CAGR: {(np.exp(b_total) - 1) * 100:.2f}%"
 )
 
-ai_energy_full = []
-total_electricity_full = []
-for year in years_full_range:
-    year_index_from_start_hist = year - years_historical[0]
-    if year <= years_historical[-1]:
-        hist_idx = np.where(years_historical == year)[0]
-        ai_val = ai_energy_hist_values[hist_idx[0]] if len(hist_idx) > 0 else np.nan
-        total_val = (
-            total_electricity_hist_values[hist_idx[0]] if len(hist_idx) > 0 else np.nan
-        )
-    else:
-        ai_val = exponential_func(year_index_from_start_hist, a_ai, b_ai)
-        total_val = exponential_func(year_index_from_start_hist, a_total, b_total)
-    ai_energy_full.append(ai_val)
-    total_electricity_full.append(total_val)
-
-ai_energy_full = np.array(ai_energy_full)
-total_electricity_full = np.array(total_electricity_full)
+# Historical values up to the last historical year, fitted curves after it
+ai_energy_full, total_electricity_full = fitting.eval_exponentials(
+    [a_ai, a_total], [b_ai, b_total], years_full_range - years_historical[0]
+).T
+n_historical = len(years_historical)
+ai_energy_full[:n_historical] = ai_energy_hist_values
+total_electricity_full[:n_historical] = total_electricity_hist_values
 print(
     f"\nProjected AI Energy in 2050 (10yr hist extrap): {ai_energy_full[-1]:,.0f} TWh"
 )
@@ -267,21 +241,17 @@ def animate(i):
 
 
 pause_frames = 0
-ani = animation.FuncAnimation(
+
+# Save to MP4, rendering frames in parallel
+render.save(
     fig,
     animate,
-    frames=len(years_full_range) + pause_frames,
-    init_func=init,
-    blit=False,
-    interval=200,
-    repeat=False,
-)  # blit=False chosen
-
-# ani.save('energy_trends_single_yaxis_log_markers_values.gif', writer='pillow', fps=7)
-# ani.save('energy_trends_single_yaxis_log_markers_values.mp4', writer='ffmpeg', fps=7)
-# Save to MP4
-Writer = animation.writers["ffmpeg"]
-writer = Writer(fps=1, metadata=dict(artist="Me"), bitrate=1800)
-ani.save("energy_trends_single_yaxis_log_markers_values.mp4", writer=writer)
+    range(len(years_full_range) + pause_frames),
+    "energy_trends_single_yaxis_log_markers_values.mp4",
+    fps=1,
+    init=init,
+    metadata=dict(artist="Me"),
+    bitrate=1800,
+)
 
 # plt.show()
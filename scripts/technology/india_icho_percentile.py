@@ -1,6 +1,11 @@
+import os
+import sys
 import matplotlib.pyplot as plt
 import pandas as pd
 
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import ranks  # noqa: E402
+
 # Historical IChO Data for India (1999 - 2026)
 # Format: (Year, India's Unofficial Team Rank, Total Participating Countries)
 icho_data = [
@@ -36,8 +41,9 @@ icho_data = [
 # Create DataFrame
 df = pd.DataFrame(icho_data, columns=["Year", "Rank", "Total_Countries"])
 
-# Calculate the competitive percentile (Higher is better, 100% = 1st place)
-df["Percentile"] = (1 - (df["Rank"] - 1) / df["Total_Countries"]) * 100
+# Look up India's rank history with the competitive percentile (Higher is
+# better, 100% = 1st place)
+df = ranks.Ranking.from_results(df, "India").history("India")
 
 # Initialize the plot
 plt.figure(figsize=(18, 10))
@@ -1,54 +1,18 @@
+import os
+import sys
 import matplotlib.pyplot as plt
-import pandas as pd
 
-# Historical IMO Data for India (1989 - 2026)
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import datasets, ranks  # noqa: E402
+
+# Historical IMO Data for India (1989 - 2026), from data/datasets/india_imo_results.csv
 # Format: (Year, India's Rank, Total Participating Countries)
 # Note: 2020 is omitted as India did not participate due to the pandemic.
-imo_data = [
-    (1989, 25, 50),
-    (1990, 17, 54),
-    (1991, 10, 55),
-    (1992, 21, 64),
-    (1993, 15, 73),
-    (1994, 16, 69),
-    (1995, 14, 73),
-    (1996, 14, 75),
-    (1997, 15, 82),
-    (1998, 7, 76),
-    (1999, 18, 81),
-    (2000, 14, 82),
-    (2001, 7, 83),
-    (2002, 9, 84),
-    (2003, 15, 82),
-    (2004, 14, 85),
-    (2005, 36, 91),
-    (2006, 35, 90),
-    (2007, 25, 93),
-    (2008, 31, 97),
-    (2009, 28, 104),
-    (2010, 36, 95),
-    (2011, 23, 101),
-    (2012, 11, 100),
-    (2013, 29, 97),
-    (2014, 39, 101),
-    (2015, 37, 104),
-    (2016, 34, 109),
-    (2017, 52, 111),
-    (2018, 28, 107),
-    (2019, 15, 112),
-    (2021, 26, 107),
-    (2022, 24, 104),
-    (2023, 9, 112),
-    (2024, 4, 108),
-    (2025, 7, 110),
-    (2026, 7, 117),
-]
-
-# Create DataFrame
-df = pd.DataFrame(imo_data, columns=["Year", "Rank", "Total_Countries"])
+df = datasets.load("india_imo_results")
 
-# Calculate the competitive percentile (Higher is better, 100% = 1st place)
-df["Percentile"] = (1 - (df["Rank"] - 1) / df["Total_Countries"]) * 100
+# Look up India's rank history with the competitive percentile (Higher is
+# better, 100% = 1st place)
+df = ranks.Ranking.from_results(df, "India").history("India")
 
 # Initialize the plot
 plt.figure(figsize=(18, 10))
@@ -122,16 +86,18 @@ plt.annotate(
     fontname="Segoe UI Emoji",
 )
 
+first_year, last_year = df["Year"].iloc[0], df["Year"].iloc[-1]
+
 # Plot customization
 plt.title(
-    f"India's IMO Performance Percentile ({imo_data[0][0]} - {imo_data[-1][0]})\nRelative Positioning to Overall Pool Size",
+    f"India's IMO Performance Percentile ({first_year} - {last_year})\nRelative Positioning to Overall Pool Size",
     fontsize=16,
     fontweight="bold",
     pad=15,
 )
 plt.xlabel("Year", fontsize=12, labelpad=10)
 plt.ylabel("Competitive Percentile (%) — Higher is Better", fontsize=12, labelpad=10)
-plt.xlim(imo_data[0][0] - 1, imo_data[-1][0] + 1)
+plt.xlim(first_year - 1, last_year + 1)
 plt.ylim(minpct - 6, 103)
 plt.grid(True, linestyle=":", alpha=0.6)
 plt.legend(loc="lower left", fontsize=11)
@@ -1,6 +1,10 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from numpy.polynomial.polynomial import polyfit, polyval
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from common import projection  # noqa: E402
 
 # SaaS Market Size Data from Precedence Research
 saas_years = np.arange(2024, 2035)
@@ -9,9 +13,12 @@ saas_market_size_2025 = 0.40821
 saas_cagr = 0.1332
 
 # Calculate SaaS market size for the forecast period
-saas_market_size = [saas_market_size_2024, saas_market_size_2025]
-for year in range(2026, 2035):
-    saas_market_size.append(saas_market_size[-1] * (1 + saas_cagr))
+saas_market_size = np.concatenate(
+    [
+        [saas_market_size_2024, saas_market_size_2025],
+        projection.compound(saas_market_size_2025, 1 + saas_cagr, 2034 - 2025)[:, 0],
+    ]
+)
 
 # World GDP Data
 gdp_years = np.arange(2024, 2035)
@@ -19,11 +26,15 @@ gdp_2023 = 105  # in trillion USD
 gdp_growth_2024_2025 = 0.032
 gdp_growth_2026_onwards = 0.030
 
-world_gdp = [gdp_2023 * (1 + gdp_growth_2024_2025)]  # GDP for 2024
-world_gdp.append(world_gdp[-1] * (1 + gdp_growth_2024_2025))  # GDP for 2025
-
-for year in range(2026, 2035):
-    world_gdp.append(world_gdp[-1] * (1 + gdp_growth_2026_onwards))
+world_gdp_2024_2025 = projection.compound(gdp_2023, 1 + gdp_growth_2024_2025, 2)[:, 0]
+world_gdp = np.concatenate(
+    [
+        world_gdp_2024_2025,
+        projection.compound(
+            world_gdp_2024_2025[-1], 1 + gdp_growth_2026_onwards, 2034 - 2025
+        )[:, 0],
+    ]
+)
 
 # AI Market Size Data from MarketsandMarkets
 ai_years = np.arange(2024, 2035)
@@ -31,25 +42,24 @@ ai_market_size_2025 = 0.37171  # in trillion USD
 ai_cagr = 0.306
 
 # Calculate AI market size for the forecast period
-ai_market_size = [ai_market_size_2025 / (1 + ai_cagr)]  # 2024
-ai_market_size.append(ai_market_size_2025)
-for year in range(2026, 2035):
-    ai_market_size.append(ai_market_size[-1] * (1 + ai_cagr))
+ai_market_size = np.concatenate(
+    [
+        [ai_market_size_2025 / (1 + ai_cagr), ai_market_size_2025],  # 2024, 2025
+        projection.compound(ai_market_size_2025, 1 + ai_cagr, 2034 - 2025)[:, 0],
+    ]
+)
 
 # --- Extrapolation ---
 projection_years = np.arange(2034, 2201)
 
-# GDP projection
-gdp_coeffs = polyfit(gdp_years, world_gdp, 2)
-gdp_projection = polyval(projection_years, gdp_coeffs)
-
-# SaaS projection
-saas_coeffs = polyfit(saas_years, saas_market_size, 3)
-saas_projection = polyval(projection_years, saas_coeffs)
-
-# AI projection
-ai_coeffs = polyfit(ai_years, ai_market_size, 4)
-ai_projection = polyval(projection_years, ai_coeffs)
+# GDP (degree 2), SaaS (degree 3) and AI (degree 4) projections, fitted
+# together since all three series share the same years
+trend_fit = projection.fit_polynomials(
+    gdp_years, np.column_stack([world_gdp, saas_market_size, ai_market_size]), [2, 3, 4]
+)
+gdp_projection, saas_projection, ai_projection = projection.eval_polynomials(
+    trend_fit, projection_years
+).T
 
 # --- Scaling ---
 # Convert GDP from trillions to trillions and scale it to be on a similar range as SaaS